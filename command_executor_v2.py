@@ -4,24 +4,144 @@ Updated Command Executor with Working Multi-Terminal Support
 This version uses proven parallel execution that actually works
 """
 
+import asyncio
+import atexit
+import bisect
+import functools
+import itertools
+import re
 import subprocess
 import shlex
-import json
 import time
 import os
+import platform
+import signal
+import tempfile
 import threading
-from typing import Union, Dict, Any, List, Optional, Tuple
-from config import SUDO_PASSWORD, COMMAND_TIMEOUT_SECONDS, Colors, print_colored
+from dataclasses import dataclass
+from typing import Union, Dict, Any, List, Optional, Sequence, Tuple
+from config import SUDO_PASSWORD, COMMAND_TIMEOUT_SECONDS, MAX_PARALLEL_TASKS, Colors, print_colored, print_colored_many, json_dumps
 from pentesting_tools import tools_manager
 from custom_functions import custom_functions
 from security_validator import CommandValidator
-from enhanced_logger import EnhancedLogger
+from enhanced_logger import enhanced_logger
 from wordlist_manager import wordlist_manager
 from session_manager import session_manager
 
+# The platform is fixed for the life of the process, so pick the shell wrapper once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_USE_SHELL = not _IS_WINDOWS
+# On Windows, bash commands run inside WSL
+_WSL_PREFIX = ("wsl.exe", "-e", "bash", "-lc")
+# The shell subprocess uses for shell=True
+_POSIX_SHELL = "/bin/sh"
+
+def shell_args(command: str) -> Union[str, List[str]]:
+    """Command as passed to subprocess: a shell string, or a WSL argv on Windows"""
+    return [*_WSL_PREFIX, command] if _IS_WINDOWS else command
+
 # Initialize components
 security_validator = CommandValidator()
-logger = EnhancedLogger()
+# Share the agent's logger so security events go through one queue and log file
+logger = enhanced_logger
+
+# Per-task cap on captured output; anything beyond it is discarded
+MAX_OUTPUT_BYTES = 4 * 1024 * 1024
+
+# Outputs longer than this are echoed as a head/tail preview
+OUTPUT_PREVIEW_LINES = 100
+
+# Finished parallel tasks remembered for collect_results:, oldest forgotten first
+COMPLETED_TASKS_KEPT = 1000
+
+# apt/apt-get invocations that don't already pass -y somewhere in the command
+APT_RE = re.compile(r'\b(apt(?:-get)?) (?!.*(?<!\S)-y\b)')
+
+# sudo invocations, rewritten to take the password from the askpass helper
+_SUDO_RE = re.compile(r'(?<![\w-])sudo ')
+
+# Tools that need raw socket access and therefore sudo
+SUDO_TOOLS_RE = re.compile(r'\b(nmap|masscan|tcpdump)\b')
+
+# Output tokens looked for by analyze_results, mapped to a finding category
+OUTPUT_TOKENS = {
+    'open': 'open_ports',
+    'filtered': 'filtered_ports',
+    'server:': 'server_header',
+    'x-powered-by:': 'powered_by',
+    'vuln': 'vulnerability',
+    'status: 200': 'found_path',
+    'found': 'found_path',
+    'mx': 'dns_record',
+    'ns': 'dns_record',
+    'txt': 'dns_record',
+}
+
+# (tool names in the command, [(token category, finding)]) in precedence order
+TOOL_FINDING_RULES = (
+    (('nmap',), (('open_ports', "Open ports detected"), ('filtered_ports', "Filtered ports found"))),
+    (('curl', 'wget'), (('server_header', "Web server information disclosed"), ('powered_by', "Technology stack revealed"))),
+    (('nikto',), (('vulnerability', "Web vulnerabilities detected"),)),
+    (('gobuster', 'dirb'), (('found_path', "Hidden directories/files discovered"),)),
+    (('dig', 'nslookup'), (('dns_record', "DNS records enumerated"),)),
+)
+
+# One group per token, matched case-insensitively so outputs never need a lowercased copy.
+# The lookahead reports overlapping tokens too, like repeated `in` checks.
+_TOKEN_CATEGORIES = tuple(OUTPUT_TOKENS.values())
+_TOKEN_RE = re.compile("(?=" + "|".join(f"({re.escape(t)})" for t in OUTPUT_TOKENS) + ")", re.IGNORECASE)
+
+def match_output_tokens_batch(outputs: List[str]) -> List[set]:
+    """Return the finding categories for each of many outputs in one pass over them all"""
+    # Outputs are NUL-separated so no token can match across two of them
+    blob = "\x00".join(outputs)
+    starts = list(itertools.accumulate((len(output) + 1 for output in outputs[:-1]), initial=0))
+    hits = [set() for _ in outputs]
+    for m in _TOKEN_RE.finditer(blob):
+        hits[bisect.bisect_right(starts, m.start()) - 1].add(_TOKEN_CATEGORIES[m.lastindex - 1])
+    return hits
+
+class _LoopHolder:
+    """Long-lived event loop on a daemon thread, shared by all parallel batches"""
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            if cls._loop is None or cls._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="executor-loop", daemon=True).start()
+                atexit.register(loop.call_soon_threadsafe, loop.stop)
+                cls._loop = loop
+            return cls._loop
+    
+    @classmethod
+    def submit(cls, coro):
+        """Run a coroutine on the shared loop and block until it finishes"""
+        return asyncio.run_coroutine_threadsafe(coro, cls.get_loop()).result()
+    
+    @classmethod
+    def _reset(cls):
+        # The loop thread does not survive fork(); children build their own
+        cls._loop = None
+        cls._lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_LoopHolder._reset)
+
+@dataclass
+class ParallelTask:
+    """A command scheduled as part of one parallel batch"""
+    task_id: str
+    command: str
+    output_file: Optional[str]
+    start_time: float
+    phase: str
+    tool_category: str
+    # Set for commands given as argv lists, which are exec'd without a shell
+    argv: Optional[Tuple[str, ...]] = None
 
 class ParallelExecutor:
     """Handles parallel command execution with real results"""
@@ -31,132 +151,212 @@ class ParallelExecutor:
         # Use session manager's results directory
         self.results_dir = session_manager.results_dir
         os.makedirs(self.results_dir, exist_ok=True)
-        self.active_tasks = {}
+        self.max_parallel = MAX_PARALLEL_TASKS
+        # Batch number in task ids keeps batches started in the same millisecond apart
+        self._batch_ids = itertools.count()
+        # task_id -> result without its output (that stays in output_file), for collect_results:
+        self.completed_tasks: Dict[str, Dict] = {}
+        self._completed_lock = threading.Lock()
+    
+    @staticmethod
+    def _write_output(output_file: str, data: bytes):
+        """Persist captured task output to the results directory"""
+        try:
+            with open(output_file, 'wb') as f:
+                f.write(data)
+        except OSError:
+            pass
     
-    def execute_parallel_commands(self, commands: List[str], phase: str, tool_category: str, expected_outcome: str) -> Dict:
-        """Execute multiple commands in parallel and return results"""
+    async def _run_one(self, cmd: Union[str, Tuple[str, ...]], start_time: float, output_file: Optional[str] = None,
+                       sem: Optional[asyncio.Semaphore] = None) -> Tuple[bytes, int, float, bool, bool]:
+        """Run a single command once a concurrency slot is free"""
+        if sem is None:
+            return await self._run_unbounded(cmd, start_time, output_file)
+        async with sem:
+            return await self._run_unbounded(cmd, start_time, output_file)
+    
+    @staticmethod
+    async def _read_capped(stream: asyncio.StreamReader) -> Tuple[bytes, bool]:
+        """Read a stream to EOF, keeping at most MAX_OUTPUT_BYTES of it"""
+        chunks = []
+        kept = 0
+        truncated = False
+        while True:
+            chunk = await stream.read(64 * 1024)
+            if not chunk:
+                break
+            room = MAX_OUTPUT_BYTES - kept
+            if len(chunk) > room:
+                # Keep draining so the process is not blocked on a full pipe
+                truncated = True
+                chunk = chunk[:room]
+            if chunk:
+                chunks.append(chunk)
+                kept += len(chunk)
+        return b"".join(chunks), truncated
+    
+    async def _run_unbounded(self, cmd: Union[str, Tuple[str, ...]], start_time: float,
+                             output_file: Optional[str] = None) -> Tuple[bytes, int, float, bool, bool]:
+        """Run a single command and capture its combined stdout/stderr
+        
+        A string goes through /bin/sh; an argv tuple is exec'd directly.
+        """
+        is_shell = isinstance(cmd, str)
+        if _IS_WINDOWS:
+            argv, options = shell_args(cmd if is_shell else shlex.join(cmd)), {}
+        else:
+            # Own session so a timeout can kill the whole process group. Python's own fds are
+            # non-inheritable (PEP 446), so close_fds=False only spares the child an fd sweep.
+            argv, options = (_POSIX_SHELL, "-c", cmd) if is_shell else cmd, {"start_new_session": True, "close_fds": False}
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.base_dir,
+                **options
+            )
+        except FileNotFoundError:
+            # Without a shell nobody reports the missing program, so answer as sh would
+            return f"{argv[0]}: command not found\n".encode(), 127, time.time() - start_time, False, False
+        try:
+            (stdout, truncated), _ = await asyncio.wait_for(
+                asyncio.gather(self._read_capped(process.stdout), process.wait()),
+                timeout=COMMAND_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            # Kill the whole process group so children of the shell release the pipe too
+            try:
+                if _IS_WINDOWS:
+                    process.kill()
+                else:
+                    os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            try:
+                logger.log_security_event("command_timeout", cmd if is_shell else shlex.join(cmd), f"Killed after {COMMAND_TIMEOUT_SECONDS} seconds")
+            except:
+                pass
+            return b"", -100, time.time() - start_time, True, False
+        
+        if output_file:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_output, output_file, stdout)
+        return stdout, process.returncode, time.time() - start_time, False, truncated
+    
+    async def _run_all(self, commands: List[Union[str, Tuple[str, ...]]], start_time: float, output_files: List[Optional[str]],
+                       max_parallel: int) -> List[Tuple[bytes, int, float, bool, bool]]:
+        """Run all commands concurrently on a single event loop, at most max_parallel at a time"""
+        sem = asyncio.Semaphore(max(1, max_parallel))
+        return await asyncio.gather(*(
+            self._run_one(cmd, start_time, output_file, sem)
+            for cmd, output_file in zip(commands, output_files)
+        ))
+    
+    def execute_parallel_commands(self, commands: List[Union[str, Sequence[str]]], phase: str, tool_category: str,
+                                  expected_outcome: str, persist: bool = False, max_parallel: Optional[int] = None) -> Dict:
+        """Execute multiple commands in parallel and return results
+        
+        Each command is a shell string or an argv list; argv lists skip the
+        /bin/sh process and are reported under their shlex.join() form.
+        Output is kept in memory, capped at MAX_OUTPUT_BYTES per task (see each
+        result's 'truncated'); pass persist=True to also save each task's
+        output to the session results directory. At most max_parallel tasks
+        (default REDTEAM_MAX_PARALLEL) run at once.
+        """
         
         print_colored(f"🚀 Launching {len(commands)} parallel tasks...", Colors.CYAN, bold=True)
         
-        processes = []
-        task_ids = []
+        tasks: List[ParallelTask] = []
         start_time = time.time()
+        batch = next(self._batch_ids)
         
-        # Launch all commands in parallel
         for i, cmd in enumerate(commands):
+            argv = None if isinstance(cmd, str) else tuple(cmd)
+            if argv is not None:
+                cmd = shlex.join(argv)
             if not cmd.strip():
                 continue
                 
-            task_id = f"task_{int(time.time() * 1000)}_{i}"
-            task_ids.append(task_id)
-            
-            output_file = os.path.join(self.results_dir, f"{task_id}_output.txt")
+            task_id = f"task_{int(start_time * 1000)}_{batch}_{i}"
+            output_file = os.path.join(self.results_dir, f"{task_id}_output.txt") if persist else None
+            tasks.append(ParallelTask(task_id, cmd, output_file, start_time, phase, tool_category, argv))
             
             print_colored(f"   📋 Task {task_id}: {cmd[:60]}...", Colors.YELLOW)
-            
-            # Launch process with output redirection
-            with open(output_file, 'w') as f:
-                process = subprocess.Popen(
-                    cmd,
-                    shell=True,
-                    stdout=f,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    cwd=self.base_dir
-                )
-            
-            self.active_tasks[task_id] = {
-                'process': process,
-                'command': cmd,
-                'output_file': output_file,
-                'start_time': start_time,
-                'phase': phase,
-                'tool_category': tool_category
-            }
-            processes.append((process, task_id))
         
-        # Wait for all processes to complete
-        print_colored(f"\n⏳ Waiting for {len(processes)} tasks to complete...", Colors.CYAN)
+        # Launch all commands and wait for them on one event loop
+        print_colored(f"\n⏳ Waiting for {len(tasks)} tasks to complete...", Colors.CYAN)
+        
+        completed = _LoopHolder.submit(self._run_all([task.argv or task.command for task in tasks], start_time,
+                                                     [task.output_file for task in tasks],
+                                                     max_parallel or self.max_parallel))
         
         results = []
-        for process, task_id in processes:
-            return_code = process.wait()
-            end_time = time.time()
-            execution_time = end_time - start_time
-            
-            task_info = self.active_tasks[task_id]
-            
-            # Read output
-            try:
-                with open(task_info['output_file'], 'r') as f:
-                    output = f.read()
-            except:
-                output = "Error reading output"
+        for task, (stdout, return_code, execution_time, timed_out, truncated) in zip(tasks, completed):
+            output = stdout.decode('utf-8', errors='replace')
             
             result = {
-                'task_id': task_id,
-                'command': task_info['command'],
+                'task_id': task.task_id,
+                'command': task.command,
                 'return_code': return_code,
                 'execution_time': execution_time,
                 'output': output,
-                'output_file': task_info['output_file'],
+                'truncated': truncated,
+                'output_file': task.output_file,
                 'phase': phase,
                 'tool_category': tool_category,
-                'status': 'success' if return_code == 0 else 'failed'
+                'status': 'timeout' if timed_out else ('success' if return_code == 0 else 'failed')
             }
             
             results.append(result)
         
         total_time = time.time() - start_time
         
-        # Clean up
-        for task_id in task_ids:
-            if task_id in self.active_tasks:
-                del self.active_tasks[task_id]
+        self._remember(results)
         
         return {
             'total_tasks': len(results),
             'successful_tasks': sum(1 for r in results if r['status'] == 'success'),
             'failed_tasks': sum(1 for r in results if r['status'] == 'failed'),
+            'timeout_tasks': sum(1 for r in results if r['status'] == 'timeout'),
             'total_execution_time': total_time,
             'results': results,
-            'task_ids': task_ids
+            'task_ids': [task.task_id for task in tasks]
         }
     
+    def _remember(self, results: List[Dict]):
+        """Record finished tasks for collect_results:, keeping at most COMPLETED_TASKS_KEPT"""
+        with self._completed_lock:
+            for result in results:
+                self.completed_tasks[result['task_id']] = {k: v for k, v in result.items() if k != 'output'}
+            while len(self.completed_tasks) > COMPLETED_TASKS_KEPT:
+                del self.completed_tasks[next(iter(self.completed_tasks))]
+    
     def analyze_results(self, parallel_result: Dict) -> Dict:
         """Analyze parallel execution results for security findings"""
         
         findings = []
         recommendations = []
         
+        # Pair each successful result with the rules for the first tool its command uses
+        matched = []
         for result in parallel_result['results']:
             if result['status'] == 'success' and result['output']:
-                output = result['output'].lower()
-                
-                # Analyze different tool outputs
-                if 'nmap' in result['command']:
-                    if 'open' in output:
-                        findings.append(f"Open ports detected: {result['command']}")
-                    if 'filtered' in output:
-                        findings.append(f"Filtered ports found: {result['command']}")
-                
-                elif 'curl' in result['command'] or 'wget' in result['command']:
-                    if 'server:' in output:
-                        findings.append(f"Web server information disclosed: {result['command']}")
-                    if 'x-powered-by:' in output:
-                        findings.append(f"Technology stack revealed: {result['command']}")
-                
-                elif 'nikto' in result['command']:
-                    if 'vulnerability' in output or 'vuln' in output:
-                        findings.append(f"Web vulnerabilities detected: {result['command']}")
-                
-                elif 'gobuster' in result['command'] or 'dirb' in result['command']:
-                    if 'status: 200' in output or 'found' in output:
-                        findings.append(f"Hidden directories/files discovered: {result['command']}")
-                
-                elif 'dig' in result['command'] or 'nslookup' in result['command']:
-                    if 'mx' in output or 'ns' in output or 'txt' in output:
-                        findings.append(f"DNS records enumerated: {result['command']}")
+                command = result['command']
+                for tools, rules in TOOL_FINDING_RULES:
+                    if any(tool in command for tool in tools):
+                        matched.append((command, rules, result['output']))
+                        break
+        
+        # Scan every relevant output in a single pass
+        all_hits = match_output_tokens_batch([output for _, _, output in matched]) if matched else []
+        
+        # Analyze different tool outputs
+        for (command, rules, _), hits in zip(matched, all_hits):
+            for category, finding in rules:
+                if category in hits:
+                    findings.append(f"{finding}: {command}")
         
         # Generate recommendations based on findings
         if any('open ports' in f for f in findings):
@@ -177,11 +377,30 @@ class ParallelExecutor:
 # Global parallel executor instance
 parallel_executor = ParallelExecutor()
 
-def execute_command(command: str, phase: str = "unknown", tool_category: str = "unknown", 
-                   expected_outcome: str = "Unknown", run_in_terminal: bool = False) -> tuple[str, int, bool]:
+def execute_command(command: str = "", phase: str = "unknown", tool_category: str = "unknown", 
+                   expected_outcome: str = "Unknown", run_in_terminal: bool = False,
+                   commands: Optional[List[str]] = None, parallel: bool = False) -> tuple[str, int, bool]:
     """
-    Enhanced command executor with parallel execution support
+    Executes a shell command or custom function, with parallel execution support.
+    
+    Pass commands=[...] with parallel=True to run a batch without the
+    parallel_execute: string form (commands may then contain ';').
+    
+    Special command formats:
+    - custom_function:function_name:param1,param2,param3
+    - install_tool:tool_name
+    - report_generation
+    - parallel_execute:command1;command2;command3
+    - collect_results:task_id1,task_id2,task_id3
     """
+    if parallel:
+        return _execute_command_batch(commands or [], phase, tool_category, expected_outcome)
+
+    if not command:
+        return "Error: No command to execute.", -1, False
+
+    if command.strip().lower() == "exit":
+        return "LLM requested exit, no shell command executed.", 0, False
     
     # Log the execution attempt (simplified)
     try:
@@ -190,7 +409,8 @@ def execute_command(command: str, phase: str = "unknown", tool_category: str = "
         pass  # Continue if logging fails
     
     # Security validation
-    if not security_validator.validate_command(command):
+    is_safe, _, _ = security_validator.validate_command(command)
+    if not is_safe:
         error_msg = "🚫 Command blocked by security validator"
         print_colored(error_msg, Colors.RED)
         return error_msg, -1, True
@@ -198,51 +418,13 @@ def execute_command(command: str, phase: str = "unknown", tool_category: str = "
     # Update command with correct wordlist paths
     command = wordlist_manager.update_command_with_wordlist(command)
     
-    # Handle parallel execution commands
-    if command.startswith("parallel_execute:"):
-        commands_str = command.replace("parallel_execute:", "").strip()
-        commands = [cmd.strip() for cmd in commands_str.split(";") if cmd.strip()]
-        
-        if not commands:
-            return "No valid commands provided for parallel execution", -1, True
-        
-        # Execute in parallel
-        parallel_result = parallel_executor.execute_parallel_commands(
-            commands, phase, tool_category, expected_outcome
-        )
-        
-        # Print summary
-        print_colored(f"\n🏁 Parallel execution completed!", Colors.GREEN, bold=True)
-        print_colored(f"📊 Results: {parallel_result['successful_tasks']}/{parallel_result['total_tasks']} successful", Colors.CYAN)
-        print_colored(f"⏱️  Total time: {parallel_result['total_execution_time']:.2f}s", Colors.CYAN)
-        
-        # Analyze results
-        analysis = parallel_executor.analyze_results(parallel_result)
-        
-        if analysis['findings']:
-            print_colored("\n🎯 SECURITY FINDINGS:", Colors.RED, bold=True)
-            for finding in analysis['findings']:
-                print_colored(f"   • {finding}", Colors.YELLOW)
-        
-        if analysis['recommendations']:
-            print_colored("\n💡 RECOMMENDATIONS:", Colors.BLUE, bold=True)
-            for rec in analysis['recommendations']:
-                print_colored(f"   • {rec}", Colors.CYAN)
-        
-        # Return combined results
-        return json.dumps({
-            'parallel_execution': True,
-            'summary': parallel_result,
-            'analysis': analysis
-        }, indent=2), 0, False
-    
-    # Handle result collection commands  
-    if command.startswith("collect_results:"):
-        # This is mainly for compatibility - results are collected automatically above
-        return json.dumps({
-            'message': 'Results are collected automatically in parallel execution',
-            'results_dir': parallel_executor.results_dir
-        }, indent=2), 0, False
+    # Handle special commands
+    if command in EXACT_HANDLERS:
+        return EXACT_HANDLERS[command]()
+    prefix, sep, _ = command.partition(":")
+    handler = PREFIX_HANDLERS.get(prefix) if sep else None
+    if handler:
+        return handler(command, phase, tool_category, expected_outcome)
     
     # Handle single terminal execution
     if run_in_terminal:
@@ -256,8 +438,8 @@ def execute_command(command: str, phase: str = "unknown", tool_category: str = "
         # Execute and wait for completion
         with open(output_file, 'w') as f:
             result = subprocess.run(
-                command,
-                shell=True,
+                shell_args(command),
+                shell=_USE_SHELL,
                 stdout=f,
                 stderr=subprocess.STDOUT,
                 text=True,
@@ -267,112 +449,418 @@ def execute_command(command: str, phase: str = "unknown", tool_category: str = "
         
         execution_time = time.time() - start_time
         
-        # Read output
+        # Read output, bounded like parallel task output
         try:
-            with open(output_file, 'r') as f:
-                output = f.read()
+            with open(output_file, 'rb') as f:
+                data = f.read(MAX_OUTPUT_BYTES + 1)
+            output = data[:MAX_OUTPUT_BYTES].decode('utf-8', errors='replace')
+            if len(data) > MAX_OUTPUT_BYTES:
+                output += f"\n[Output truncated at {MAX_OUTPUT_BYTES} bytes; full output in {output_file}]"
         except:
             output = "Error reading output"
         
         print_colored(f"✅ Command completed in {execution_time:.2f}s", Colors.GREEN)
         return output, result.returncode, False
     
-    # Handle custom functions
-    if command.startswith("custom_function:"):
-        function_name = command.replace("custom_function:", "").strip()
-        return execute_custom_function(function_name)
-    
     # Standard execution for non-parallel commands
+    # Raw-socket tools need sudo; execute_shell_command supplies the password
+    if SUDO_PASSWORD and SUDO_TOOLS_RE.search(command) and not command.lstrip().startswith("sudo "):
+        command = f"sudo {command}"
+    
+    output, return_code, timed_out = execute_shell_command(command)
+    
+    # Log result (simplified)
     try:
-        print_colored(f"🔄 Executing: {command}", Colors.YELLOW)
-        
-        # Determine if sudo is needed
-        needs_sudo = any(cmd in command for cmd in ['nmap', 'masscan', 'tcpdump'])
-        
-        if needs_sudo and SUDO_PASSWORD:
-            # Execute with sudo using echo for password input
-            full_command = f"echo '{SUDO_PASSWORD}' | sudo -S {command}"
+        logger.log_security_event("command_result", command, f"Return code: {return_code}, Output length: {len(output)}")
+    except:
+        pass
+    
+    return output, return_code, timed_out
+
+def execute_argv(argv: Sequence[str] = (), phase: str = "unknown", tool_category: str = "unknown",
+                 expected_outcome: str = "Unknown", argvs: Optional[Sequence[Sequence[str]]] = None,
+                 parallel: bool = False) -> tuple[str, int, bool]:
+    """
+    Executes a command given as an argv list, exec'd directly without /bin/sh.
+    
+    Pass argvs=[[...], ...] with parallel=True to run a batch. There is no shell,
+    so pipes, redirection and globbing are unavailable; use execute_command for those.
+    """
+    if parallel:
+        return _execute_command_batch(list(argvs or []), phase, tool_category, expected_outcome)
+    
+    if not argv:
+        return "Error: No command to execute.", -1, False
+    command = shlex.join(argv)
+    
+    try:
+        logger.log_security_event("command_execution", command, f"Phase: {phase}, Category: {tool_category}")
+    except:
+        pass  # Continue if logging fails
+    
+    # Security validation
+    is_safe, _, _ = security_validator.validate_command(command)
+    if not is_safe:
+        error_msg = "🚫 Command blocked by security validator"
+        print_colored(error_msg, Colors.RED)
+        return error_msg, -1, True
+    
+    argv = [wordlist_manager.update_command_with_wordlist(arg) for arg in argv]
+    
+    # Raw-socket tools need sudo; on Windows the command runs inside WSL's bash anyway
+    if SUDO_PASSWORD and SUDO_TOOLS_RE.search(argv[0]):
+        argv = ["sudo", *argv]
+    if _IS_WINDOWS:
+        output, return_code, timed_out = execute_shell_command(shlex.join(argv))
+    else:
+        env = None
+        if argv[0] == "sudo":
+            argv = ["sudo", "-A", *argv[1:]]
+            env = {**os.environ, "SUDO_ASKPASS": _askpass_helper()}
+        output, return_code, timed_out = _run_and_report(argv, shlex.join(argv), env, False, command)
+    
+    try:
+        logger.log_security_event("command_result", command, f"Return code: {return_code}, Output length: {len(output)}")
+    except:
+        pass
+    
+    return output, return_code, timed_out
+
+def _execute_command_batch(commands: list, phase: str, tool_category: str, expected_outcome: str) -> tuple[str, int, bool]:
+    """Validate each command (shell string or argv list) of a structured batch, then run it in parallel"""
+    checked = []
+    for cmd in commands:
+        if isinstance(cmd, str):
+            cmd = display = cmd.strip()
         else:
-            full_command = command
+            display = shlex.join(cmd)
+        if not display:
+            continue
+        try:
+            logger.log_security_event("command_execution", display, f"Phase: {phase}, Category: {tool_category}")
+        except:
+            pass  # Continue if logging fails
+        is_safe, _, _ = security_validator.validate_command(display)
+        if not is_safe:
+            error_msg = f"🚫 Command blocked by security validator: {display}"
+            print_colored(error_msg, Colors.RED)
+            return error_msg, -1, True
+        if isinstance(cmd, str):
+            checked.append(wordlist_manager.update_command_with_wordlist(cmd))
+        else:
+            checked.append([wordlist_manager.update_command_with_wordlist(arg) for arg in cmd])
+    return run_parallel_batch(checked, phase, tool_category, expected_outcome)
+
+def execute_parallel_commands(command: str, phase: str, tool_category: str, expected_outcome: str) -> tuple[str, int, bool]:
+    """Run a parallel_execute:cmd1;cmd2 batch and report the analysed results"""
+    commands_str = command.replace("parallel_execute:", "").strip()
+    commands = [cmd.strip() for cmd in commands_str.split(";") if cmd.strip()]
+    return run_parallel_batch(commands, phase, tool_category, expected_outcome)
+
+def run_parallel_batch(commands: list, phase: str, tool_category: str, expected_outcome: str) -> tuple[str, int, bool]:
+    """Run a list of commands in parallel and report the analysed results"""
+    if not commands:
+        return "No valid commands provided for parallel execution", -1, True
+    
+    # Execute in parallel
+    # Persist outputs so they are archived with the session
+    parallel_result = parallel_executor.execute_parallel_commands(
+        commands, phase, tool_category, expected_outcome, persist=True
+    )
+    
+    # Print summary
+    print_colored(f"\n🏁 Parallel execution completed!", Colors.GREEN, bold=True)
+    print_colored(f"📊 Results: {parallel_result['successful_tasks']}/{parallel_result['total_tasks']} successful", Colors.CYAN)
+    print_colored(f"⏱️  Total time: {parallel_result['total_execution_time']:.2f}s", Colors.CYAN)
+    
+    # Analyze results
+    analysis = parallel_executor.analyze_results(parallel_result)
+    
+    if analysis['findings']:
+        print_colored("\n🎯 SECURITY FINDINGS:", Colors.RED, bold=True)
+        for finding in analysis['findings']:
+            print_colored(f"   • {finding}", Colors.YELLOW)
+    
+    if analysis['recommendations']:
+        print_colored("\n💡 RECOMMENDATIONS:", Colors.BLUE, bold=True)
+        for rec in analysis['recommendations']:
+            print_colored(f"   • {rec}", Colors.CYAN)
+    
+    # Return combined results
+    return json_dumps({
+        'parallel_execution': True,
+        'task_ids': parallel_result['task_ids'],
+        'summary': parallel_result,
+        'analysis': analysis
+    }), 0, False
+
+def collect_parallel_results(command: str, *context) -> tuple[str, int, bool]:
+    """Report the recorded results of earlier parallel tasks, given as collect_results:task_id1,task_id2"""
+    task_ids = [tid.strip() for tid in command.replace("collect_results:", "").split(",") if tid.strip()]
+    print_colored(f"📊 Collecting results from {len(task_ids)} tasks...", Colors.CYAN, bold=True)
+    
+    # Batches finish before execute_command returns, so the tasks only need looking up
+    results = []
+    unknown = []
+    for task_id in task_ids:
+        record = parallel_executor.completed_tasks.get(task_id)
+        if record is None:
+            unknown.append(task_id)
+            continue
+        output = ""
+        if record['output_file']:
+            try:
+                with open(record['output_file'], 'rb') as f:
+                    output = f.read(MAX_OUTPUT_BYTES).decode('utf-8', errors='replace')
+            except OSError:
+                pass
+        results.append({**record, 'output': output})
+    
+    if unknown:
+        print_colored(f"⚠️  Unknown or forgotten task ids: {', '.join(unknown)}", Colors.YELLOW)
+    
+    analysis = parallel_executor.analyze_results({'total_tasks': len(results), 'results': results})
+    return json_dumps({
+        'results': results,
+        'analysis': analysis,
+        'unknown_task_ids': unknown,
+        'results_dir': str(parallel_executor.results_dir)
+    }), 0 if results or not task_ids else -1, False
+
+@functools.lru_cache(maxsize=128)
+def _parse_ports(ports: str) -> tuple[int, ...]:
+    """Parse a dash-separated port list such as "22-80-443"."""
+    return tuple(int(p) for p in ports.split("-"))
+
+# Custom function names mapped to callables taking the parsed parameter list
+_CUSTOM_DISPATCH = {
+    'port_scan_basic': lambda params: custom_functions.port_scan_basic(
+        params[0], list(_parse_ports(params[1])) if len(params) > 1 else [22, 80, 443]
+    ),
+    'web_tech_detection': lambda params: custom_functions.web_technology_detection(params[0]),
+    'dns_enumeration': lambda params: custom_functions.dns_enumeration(params[0]),
+    'subdomain_enumeration': lambda params: custom_functions.dns_enumeration(params[0]),  # Alias
+    'whois_lookup': lambda params: custom_functions.whois_lookup(params[0]),
+    'vulnerability_check': lambda params: custom_functions.vulnerability_check_basic(params[0]),
+    'network_discovery': lambda params: custom_functions.network_discovery(params[0])
+}
+
+def execute_custom_function(command: str) -> tuple[str, int, bool]:
+    """Execute custom pentesting functions."""
+    try:
+        parts = command.split(":")
+        if len(parts) < 2:
+            return "Error: Invalid custom function format. Use custom_function:function_name:params", -1, False
         
-        # Execute command
-        result = subprocess.run(
-            full_command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=COMMAND_TIMEOUT_SECONDS,
-            cwd=parallel_executor.base_dir
-        )
+        function_name = parts[1]
+        params = parts[2].split(",") if len(parts) > 2 and parts[2] else []
         
-        output = result.stdout
-        if result.stderr:
-            output += f"\n[STDERR]: {result.stderr}"
+        print_colored(f"🔧 Executing custom function: {function_name}", Colors.CYAN, bold=True)
         
-        # Log result (simplified)
-        try:
-            logger.log_security_event("command_result", command, f"Return code: {result.returncode}, Output length: {len(output)}")
-        except:
-            pass
+        function = _CUSTOM_DISPATCH.get(function_name)
+        if function is None:
+            available_functions = ", ".join(_CUSTOM_DISPATCH.keys())
+            return f"Error: Unknown function '{function_name}'. Available: {available_functions}", -1, False
         
-        if result.returncode == 0:
-            print_colored(f"✅ Command successful", Colors.GREEN)
-        else:
-            print_colored(f"❌ Command failed with code {result.returncode}", Colors.RED)
+        # Execute the function
+        result = function(params)
+        formatted_result = json_dumps(result)
         
-        return output, result.returncode, result.returncode != 0
+        print_colored("✅ Custom function executed successfully", Colors.GREEN)
+        return formatted_result, 0, False
         
-    except subprocess.TimeoutExpired:
-        error_msg = f"⏰ Command timed out after {COMMAND_TIMEOUT_SECONDS} seconds"
+    except Exception as e:
+        error_msg = f"Error executing custom function: {str(e)}"
         print_colored(error_msg, Colors.RED)
-        return error_msg, -1, True
+        return error_msg, -1, False
+
+def execute_tool_installation(command: str) -> tuple[str, int, bool]:
+    """Handle tool installation requests."""
+    try:
+        tool_name = command.split(":")[1]
+        print_colored(f"🔧 Installing pentesting tool: {tool_name}", Colors.CYAN, bold=True)
+        
+        success, message = tools_manager.install_tool(tool_name)
+        return_code = 0 if success else -1
+        
+        return message, return_code, False
         
     except Exception as e:
-        error_msg = f"💥 Execution error: {str(e)}"
+        error_msg = f"Error installing tool: {str(e)}"
         print_colored(error_msg, Colors.RED)
-        return error_msg, -1, True
+        return error_msg, -1, False
 
-def execute_custom_function(function_name: str) -> tuple[str, int, bool]:
-    """Execute a custom pentesting function"""
+def execute_report_generation() -> tuple[str, int, bool]:
+    """Generate and save penetration testing report."""
     try:
-        if function_name in custom_functions:
-            print_colored(f"🔧 Executing custom function: {function_name}", Colors.CYAN)
-            result = custom_functions[function_name]()
-            print_colored(f"✅ Custom function completed", Colors.GREEN)
-            return str(result), 0, False
-        else:
-            available_functions = ", ".join(custom_functions.keys())
-            error_msg = f"❌ Custom function '{function_name}' not found. Available: {available_functions}"
-            print_colored(error_msg, Colors.RED)
-            return error_msg, -1, True
-            
+        print_colored("📊 Generating penetration testing report...", Colors.CYAN, bold=True)
+        
+        # This would typically use collected findings from the session
+        # For now, we'll create a basic structure
+        findings = {
+            'target': 'Session Target',
+            'scan_date': 'Current Session',
+            'vulnerabilities': [],
+            'recommendations': ['Review all findings', 'Implement security controls'],
+            'tools_used': ['AutoPentest AI Agent', 'Custom Functions']
+        }
+        
+        report = custom_functions.generate_report(findings)
+        
+        # Save report to file
+        with open("pentest_report.txt", "w") as f:
+            f.write(report)
+        
+        print_colored("✅ Report generated and saved to pentest_report.txt", Colors.GREEN)
+        return "Report generated successfully. Saved to pentest_report.txt", 0, False
+        
     except Exception as e:
-        error_msg = f"💥 Custom function error: {str(e)}"
+        error_msg = f"Error generating report: {str(e)}"
         print_colored(error_msg, Colors.RED)
-        return error_msg, -1, True
+        return error_msg, -1, False
+
+def print_command_output(stdout: bytes, stderr: bytes):
+    """Echo captured output indented, previewing only the head and tail of long outputs."""
+    lines = stdout.strip().splitlines() + stderr.strip().splitlines()
+    if not lines:
+        print_colored("[Executor] Output: <No output>", Colors.LIGHTBLACK_EX)
+        return
+
+    omitted = len(lines) - OUTPUT_PREVIEW_LINES
+    if omitted > 0:
+        half = OUTPUT_PREVIEW_LINES // 2
+        lines = lines[:half] + [f"... {omitted} more lines ...".encode()] + lines[-half:]
+    # Indent output for clarity, writing all lines in a single call
+    print_colored_many([("[Executor] Output:", Colors.LIGHTBLACK_EX)] +
+                       [(f"    {line.decode('utf-8', errors='replace')}", Colors.LIGHTBLACK_EX) for line in lines])
+
+@functools.lru_cache(maxsize=None)
+def _askpass_helper() -> str:
+    """Write (once) a private SUDO_ASKPASS helper that prints the sudo password."""
+    fd, path = tempfile.mkstemp(prefix="redteam_askpass_", suffix=".sh")
+    with os.fdopen(fd, "w") as f:
+        # Only sudo runs the helper, so the password never enters the commands' environment
+        f.write(f"#!/bin/sh\nprintf '%s\\n' {shlex.quote(SUDO_PASSWORD or '')}\n")
+    os.chmod(path, 0o700)
+    atexit.register(lambda: os.path.exists(path) and os.unlink(path))
+    return path
+
+def execute_shell_command(command: str) -> tuple[str, int, bool]:
+    """
+    Execute standard shell commands.
+    Handles sudo with a hardcoded password (INSECURE).
+    Handles WSL execution if on Windows.
+
+    Returns:
+        - output (str): Combined stdout and stderr of the command.
+        - return_code (int): The exit code of the command.
+        - timed_out (bool): True if the command timed out, False otherwise.
+    """
+    # !! SECURITY WARNING !! Hardcoded sudo password.
+    # This is EXTREMELY DANGEROUS for real systems.
+    processed_command = command
+    env = None
+    if "sudo" in command:
+        print_colored(
+            "!! WARNING: Using sudo with a hardcoded password. This is a major security risk. !!",
+            Colors.RED, bold=True
+        )
+        if _IS_WINDOWS:
+            # The askpass helper lives on the Windows side, so feed WSL's sudo through stdin
+            processed_command = command.replace("sudo ", f'echo "{SUDO_PASSWORD}" | sudo -S ')
+        else:
+            # sudo -A runs the helper for the password, so no echo process or pipe is needed.
+            # The password stays in the helper, off the command line and out of the environment.
+            processed_command = _SUDO_RE.sub("sudo -A ", command)
+            env = {**os.environ, "SUDO_ASKPASS": _askpass_helper()}
+
+    # Make apt non-interactive if present
+    processed_command = APT_RE.sub(r'\1 -y ', processed_command)
+
+    # Prepare command for execution (WSL or direct)
+    if _IS_WINDOWS:
+        # Assuming bash commands are to be run in WSL
+        cmd_list = [*_WSL_PREFIX, processed_command]
+    elif _SYSTEM == "Linux" or _SYSTEM == "Darwin": # Linux or macOS
+        # Execute directly. Using shell=True can be a security risk if `processed_command` is not sanitized.
+        # However, LLM generates arbitrary commands, so `shell=True` is often necessary for pipes, etc.
+        cmd_list = processed_command # Pass string to subprocess with shell=True
+    else:
+        return f"Unsupported platform: {_SYSTEM}", -1, False
+    return _run_and_report(cmd_list, processed_command, env, _USE_SHELL, command)
+
+def _run_and_report(cmd_list: Union[str, List[str]], shell_to_print: str, env: Optional[Dict[str, str]],
+                    use_shell: bool, command: str) -> tuple[str, int, bool]:
+    """Run a prepared command, echo its output, and return (output, return_code, timed_out)"""
+    print_colored(f"\n[Executor] Running Command:", Colors.CYAN, bold=True)
+    print_colored(f"  $ {shell_to_print}", Colors.LIGHTWHITE_EX)
+
+    try:
+        # For `shell=True` on Linux/macOS, cmd_list is a string.
+        # For `wsl.exe`, cmd_list is a list of arguments.
+        process = subprocess.run(
+            cmd_list,
+            shell=use_shell, # Necessary for complex shell commands like pipes if not on WSL
+            env=env,
+            capture_output=True,
+            timeout=COMMAND_TIMEOUT_SECONDS,
+            check=False # Don't raise exception for non-zero exit codes
+        )
+        return_code = process.returncode
+        timed_out = False
+
+        print_colored(f"[Executor] Return Code: {return_code}", Colors.LIGHTBLACK_EX if return_code == 0 else Colors.LIGHTRED_EX)
+        print_command_output(process.stdout, process.stderr)
+        # Combine stdout and stderr only once, for the caller
+        output = b"".join((process.stdout, process.stderr)).decode("utf-8", errors="replace")
+
+
+    except subprocess.TimeoutExpired:
+        output = f"Error: Command '{shell_to_print}' timed out after {COMMAND_TIMEOUT_SECONDS} seconds."
+        return_code = -100 # Special code for timeout
+        timed_out = True
+        print_colored(output, Colors.RED)
+    except FileNotFoundError:
+        # This could happen if wsl.exe is not found on Windows, or the command itself on Linux
+        err_msg = f"Error: Command or interpreter not found. Ensure WSL is installed and in PATH if on Windows, or the command '{shlex.split(command)[0] if command else ''}' is installed."
+        output = err_msg
+        return_code = -101 # Special code for not found
+        timed_out = False
+        print_colored(output, Colors.RED)
+    except Exception as e:
+        output = f"Error executing command '{shell_to_print}': {str(e)}"
+        return_code = -102 # Special code for other execution errors
+        timed_out = False
+        print_colored(output, Colors.RED)
+
+    return output.strip(), return_code, timed_out
+
+# Bytes of each output file shown in the results summary
+PREVIEW_BYTES = 100
 
 def get_parallel_results_summary() -> str:
     """Get a summary of recent parallel execution results"""
     try:
-        results_files = []
-        for file in os.listdir(parallel_executor.results_dir):
-            if file.endswith('_output.txt'):
-                file_path = os.path.join(parallel_executor.results_dir, file)
-                stat = os.stat(file_path)
-                results_files.append((file, stat.st_mtime))
+        # scandir hands back each entry's stat alongside its name
+        with os.scandir(parallel_executor.results_dir) as entries:
+            results_files = [
+                (entry.name, entry.path, entry.stat())
+                for entry in entries
+                if entry.name.endswith('_output.txt')
+            ]
         
         # Sort by modification time (newest first)
-        results_files.sort(key=lambda x: x[1], reverse=True)
+        results_files.sort(key=lambda x: x[2].st_mtime, reverse=True)
         
         summary = f"📊 Recent Parallel Execution Results ({len(results_files)} files):\n"
         
-        for file, mtime in results_files[:10]:  # Show last 10 results
-            file_path = os.path.join(parallel_executor.results_dir, file)
+        for file, file_path, stat in results_files[:10]:  # Show last 10 results
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    size = len(content)
-                    preview = content[:100] + "..." if len(content) > 100 else content
+                # Only the preview is needed, so never read more than that
+                with open(file_path, 'rb') as f:
+                    head = f.read(PREVIEW_BYTES).decode('utf-8', errors='replace')
+                size = stat.st_size
+                preview = head + "..." if size > PREVIEW_BYTES else head
                 
                 summary += f"\n📁 {file} ({size} bytes)\n   Preview: {preview.strip()}\n"
             except:
@@ -383,5 +871,21 @@ def get_parallel_results_summary() -> str:
     except Exception as e:
         return f"Error reading parallel results: {str(e)}"
 
+# Special command dispatch tables, keyed on the command (or its "prefix:")
+EXACT_HANDLERS = {
+    'report_generation': execute_report_generation,
+}
+
+PREFIX_HANDLERS = {
+    'custom_function': lambda command, *context: execute_custom_function(command),
+    'install_tool': lambda command, *context: execute_tool_installation(command),
+    'parallel_execute': execute_parallel_commands,
+    'collect_results': collect_parallel_results,
+}
+
 # Export main function for compatibility
-__all__ = ['execute_command', 'execute_custom_function', 'get_parallel_results_summary', 'parallel_executor']
+__all__ = [
+    'execute_command', 'execute_argv', 'execute_custom_function', 'execute_tool_installation', 'execute_report_generation',
+    'execute_shell_command', 'execute_parallel_commands', 'run_parallel_batch', 'collect_parallel_results',
+    'get_parallel_results_summary', 'parallel_executor'
+]
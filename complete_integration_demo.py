@@ -4,11 +4,46 @@ Complete Integration Demo
 Shows session management integrated with wordlist management and parallel execution
 """
 
-import time
 from session_manager import start_new_session, session_manager, list_recent_sessions
-from wordlist_manager import ensure_wordlists_ready, get_wordlist_for_tool
+from wordlist_manager import ensure_wordlists_ready, get_wordlist_for_tool, TOOL_PURPOSES
 from command_executor_v2 import execute_command
-from config import print_colored, Colors
+from config import print_colored, Colors, buffered_stdout
+
+# Session notes written at the end of the demo
+NOTES_TEMPLATE = """# Complete Integration Demo - Pentesting Notes
+
+## Session Overview
+- **Session ID**: {session_id}
+- **Target**: Complete integration demonstration
+- **Tools**: Session management + Wordlist management + Parallel execution
+
+## Phases Completed
+1. ✅ Reconnaissance
+2. ✅ Network Discovery
+3. ✅ Parallel Assessment
+
+## Key Features Demonstrated
+- Automatic session organization
+- Wordlist integration
+- Parallel command execution
+- Comprehensive logging
+- Results organization
+
+## Next Steps
+- Session will be automatically archived
+- All results preserved for future reference
+- Ready for next assessment
+"""
+
+def run_phase(commands, phase, tool_category, expected_outcome):
+    """Run a phase's independent commands as one parallel batch and return its (result, code, error)"""
+    return execute_command(
+        commands=commands,
+        parallel=True,
+        phase=phase,
+        tool_category=tool_category,
+        expected_outcome=expected_outcome
+    )
 
 def demo_complete_integration():
     """Demonstrate the complete integrated system"""
@@ -27,14 +62,7 @@ def demo_complete_integration():
     
     # Show wordlist paths for different tools
     print_colored("🛠️  Wordlist paths for tools:", Colors.CYAN)
-    tools = [
-        ("gobuster", "directory"),
-        ("ffuf", "directory"), 
-        ("dirb", "directory"),
-        ("hydra", "password")
-    ]
-    
-    for tool, purpose in tools:
+    for tool, purpose in TOOL_PURPOSES:
         path = get_wordlist_for_tool(tool, purpose)
         print_colored(f"   {tool} ({purpose}): {path}", Colors.YELLOW)
     print()
@@ -51,14 +79,7 @@ def demo_complete_integration():
         "uname -a"
     ]
     
-    for cmd in recon_commands:
-        result, code, error = execute_command(
-            command=cmd,
-            phase="reconnaissance", 
-            tool_category="information_gathering",
-            expected_outcome="Gather system information"
-        )
-        time.sleep(0.5)
+    run_phase(recon_commands, "reconnaissance", "information_gathering", "Gather system information")
     
     print()
     
@@ -71,14 +92,7 @@ def demo_complete_integration():
         "ps aux | head -10"
     ]
     
-    for cmd in network_commands:
-        result, code, error = execute_command(
-            command=cmd,
-            phase="network_discovery",
-            tool_category="network_scanning", 
-            expected_outcome="Discover network configuration"
-        )
-        time.sleep(0.5)
+    run_phase(network_commands, "network_discovery", "network_scanning", "Discover network configuration")
     
     print()
     
@@ -92,10 +106,9 @@ def demo_complete_integration():
         "echo 'Parallel task 4: File system check'"
     ]
     
-    parallel_cmd = f"parallel_execute:{';'.join(parallel_commands)}"
-    
     result, code, error = execute_command(
-        command=parallel_cmd,
+        commands=parallel_commands,
+        parallel=True,
         phase="parallel_assessment",
         tool_category="comprehensive_scanning",
         expected_outcome="Execute multiple tasks simultaneously"
@@ -117,26 +130,7 @@ def demo_complete_integration():
     print_colored("📝 STEP 5: Creating Session Documentation", Colors.BLUE, bold=True)
     
     notes_file = session_manager.current_session_dir / "pentesting_notes.md"
-    with open(notes_file, 'w') as f:
-        f.write("# Complete Integration Demo - Pentesting Notes\n\n")
-        f.write("## Session Overview\n")
-        f.write(f"- **Session ID**: {session_id}\n")
-        f.write(f"- **Target**: Complete integration demonstration\n")
-        f.write(f"- **Tools**: Session management + Wordlist management + Parallel execution\n\n")
-        f.write("## Phases Completed\n")
-        f.write("1. ✅ Reconnaissance\n")
-        f.write("2. ✅ Network Discovery\n") 
-        f.write("3. ✅ Parallel Assessment\n\n")
-        f.write("## Key Features Demonstrated\n")
-        f.write("- Automatic session organization\n")
-        f.write("- Wordlist integration\n")
-        f.write("- Parallel command execution\n")
-        f.write("- Comprehensive logging\n")
-        f.write("- Results organization\n\n")
-        f.write("## Next Steps\n")
-        f.write("- Session will be automatically archived\n")
-        f.write("- All results preserved for future reference\n")
-        f.write("- Ready for next assessment\n")
+    notes_file.write_text(NOTES_TEMPLATE.format(session_id=session_id), encoding='utf-8')
     
     print_colored(f"✅ Session notes created: {notes_file}", Colors.GREEN)
     print()
@@ -151,18 +145,19 @@ def demo_complete_integration():
     list_recent_sessions(3)
     
     # Final statistics
-    final_stats = session_manager.get_session_stats()
-    print_colored("🏆 INTEGRATION DEMO COMPLETE!", Colors.GREEN, bold=True)
-    print_colored("=" * 40, Colors.GREEN)
-    print_colored("✅ Session management: WORKING", Colors.GREEN)
-    print_colored("✅ Wordlist integration: WORKING", Colors.GREEN)
-    print_colored("✅ Parallel execution: WORKING", Colors.GREEN)
-    print_colored("✅ Automatic archiving: WORKING", Colors.GREEN)
-    print_colored("✅ Clean workspace: READY", Colors.GREEN)
-    print()
-    print_colored(f"📊 Total sessions archived: {final_stats['total_sessions']}", Colors.CYAN)
-    print_colored(f"💾 Total disk usage: {final_stats['disk_usage_mb']} MB", Colors.CYAN)
-    print_colored(f"🧹 Current workspace: CLEAN", Colors.CYAN)
+    with buffered_stdout():
+        final_stats = session_manager.get_session_stats()
+        print_colored("🏆 INTEGRATION DEMO COMPLETE!", Colors.GREEN, bold=True)
+        print_colored("=" * 40, Colors.GREEN)
+        print_colored("✅ Session management: WORKING", Colors.GREEN)
+        print_colored("✅ Wordlist integration: WORKING", Colors.GREEN)
+        print_colored("✅ Parallel execution: WORKING", Colors.GREEN)
+        print_colored("✅ Automatic archiving: WORKING", Colors.GREEN)
+        print_colored("✅ Clean workspace: READY", Colors.GREEN)
+        print()
+        print_colored(f"📊 Total sessions archived: {final_stats['total_sessions']}", Colors.CYAN)
+        print_colored(f"💾 Total disk usage: {final_stats['disk_usage_mb']} MB", Colors.CYAN)
+        print_colored(f"🧹 Current workspace: CLEAN", Colors.CYAN)
 
 if __name__ == "__main__":
     demo_complete_integration()
@@ -4,11 +4,12 @@ Complete Project Test - AI Pentester Agent with Wordlists
 Final comprehensive test of all components working together
 """
 
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 from wordlist_manager import wordlist_manager, get_wordlist_for_tool
 from command_executor_v2 import execute_command
 from multi_terminal_integration import MultiTerminalPentester
-from config import print_colored, Colors
+from config import print_colored, Colors, buffered_stdout, thread_buffered_stdout
 
 def test_complete_project():
     """Test the complete project with all features"""
@@ -23,15 +24,17 @@ def test_complete_project():
     print_colored(f"✅ Wordlist Directory: {wordlist_manager.wordlist_dir}", Colors.GREEN)
     
     # Count available wordlists
-    import os
-    wordlist_count = len([f for f in os.listdir(wordlist_manager.wordlist_dir) if f.endswith('.txt')])
+    with os.scandir(wordlist_manager.wordlist_dir) as entries:
+        wordlist_count = sum(1 for e in entries if e.name.endswith('.txt') and e.is_file(follow_symlinks=False))
     print_colored(f"✅ Available Wordlists: {wordlist_count}", Colors.GREEN)
     
     # Show key wordlist paths
     common_path = get_wordlist_for_tool("gobuster", "directory")
     subdomain_path = get_wordlist_for_tool("gobuster", "subdomain")
-    print_colored(f"✅ Directory Wordlist: {os.path.basename(common_path)} ({os.path.getsize(common_path):,} bytes)", Colors.GREEN)
-    print_colored(f"✅ Subdomain Wordlist: {os.path.basename(subdomain_path)} ({os.path.getsize(subdomain_path):,} bytes)", Colors.GREEN)
+    common_name, common_size = wordlist_manager.get_wordlist_meta(common_path)
+    subdomain_name, subdomain_size = wordlist_manager.get_wordlist_meta(subdomain_path)
+    print_colored(f"✅ Directory Wordlist: {common_name} ({common_size:,} bytes)", Colors.GREEN)
+    print_colored(f"✅ Subdomain Wordlist: {subdomain_name} ({subdomain_size:,} bytes)", Colors.GREEN)
     print()
     
     # Initialize multi-terminal pentester
@@ -43,142 +46,93 @@ def test_complete_project():
     print_colored(f"Target: {target}", Colors.YELLOW)
     print()
     
-    # Phase 1: Intelligence Gathering
-    print_colored("🔍 Phase 1: Intelligence Gathering", Colors.BLUE, bold=True)
-    
-    intel_commands = [
-        f"dig {target} ANY",
-        f"whois {target}",
-        f"nslookup {target}",
-        f"ping -c 2 {target}"
-    ]
-    
-    intel_parallel = f"parallel_execute:{';'.join(intel_commands)}"
-    
-    result1, code1, error1 = execute_command(
-        command=intel_parallel,
-        phase="intelligence_gathering",
-        tool_category="passive_reconnaissance",
-        expected_outcome="Collect target intelligence"
-    )
-    
-    time.sleep(2)
-    
-    # Phase 2: Network Discovery  
-    print_colored("\n🌐 Phase 2: Network Discovery", Colors.BLUE, bold=True)
-    
-    network_commands = [
-        f"nmap -sS -T4 -p 80,443,22,21,25,53 {target}",
-        f"nmap -sV -p 80,443 {target}",
-        f"curl -I http://{target}",
-        f"curl -I https://{target}"
-    ]
-    
-    network_parallel = f"parallel_execute:{';'.join(network_commands)}"
-    
-    result2, code2, error2 = execute_command(
-        command=network_parallel,
-        phase="network_discovery",
-        tool_category="active_scanning",
-        expected_outcome="Discover network services and technologies"
-    )
-    
-    time.sleep(2)
-    
-    # Phase 3: Web Application Testing with Wordlists
-    print_colored("\n🔧 Phase 3: Web Application Testing", Colors.BLUE, bold=True)
-    
-    # Use proper wordlist paths
-    common_wordlist = get_wordlist_for_tool("gobuster", "directory")
-    
-    web_commands = [
-        f"curl -s http://{target}/robots.txt",
-        f"curl -s http://{target}/sitemap.xml",
-        f"whatweb http://{target}",
-        f"curl -s http://{target}/.well-known/security.txt"
-    ]
-    
-    web_parallel = f"parallel_execute:{';'.join(web_commands)}"
-    
-    result3, code3, error3 = execute_command(
-        command=web_parallel,
-        phase="web_application_testing",
-        tool_category="web_analysis",
-        expected_outcome="Analyze web application structure and technologies"
-    )
-    
-    time.sleep(2)
-    
-    # Phase 4: Content Discovery with Wordlists
-    print_colored("\n📁 Phase 4: Content Discovery", Colors.BLUE, bold=True)
-    print_colored(f"Using wordlist: {os.path.basename(common_wordlist)}", Colors.YELLOW)
-    
-    # Simulate directory enumeration with common paths
-    content_commands = [
-        f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/admin",
-        f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/login",
-        f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/config",
-        f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/test"
-    ]
-    
-    content_parallel = f"parallel_execute:{';'.join(content_commands)}"
-    
-    result4, code4, error4 = execute_command(
-        command=content_parallel,
-        phase="content_discovery",
-        tool_category="directory_enumeration",
-        expected_outcome="Discover hidden files and directories"
-    )
-    
-    time.sleep(2)
-    
-    # Phase 5: Vulnerability Assessment
-    print_colored("\n🔍 Phase 5: Vulnerability Assessment", Colors.BLUE, bold=True)
-    
-    vuln_commands = [
-        f"curl -s http://{target} | grep -i 'version'",
-        f"curl -s http://{target} | grep -i 'server'",
-        f"curl -H 'User-Agent: sqlmap' http://{target}",
-        f"curl -s http://{target}/search?q=<script>alert(1)</script>"
+    # The five phases are independent (none consumes another's output), so they run concurrently
+    phases = [
+        ("🔍 Phase 1: Intelligence Gathering", "intelligence_gathering", "passive_reconnaissance",
+         "Collect target intelligence", [
+            f"dig {target} ANY",
+            f"whois {target}",
+            f"nslookup {target}",
+            f"ping -c 2 {target}"
+        ]),
+        ("🌐 Phase 2: Network Discovery", "network_discovery", "active_scanning",
+         "Discover network services and technologies", [
+            f"nmap -sS -T4 -p 80,443,22,21,25,53 {target}",
+            f"nmap -sV -p 80,443 {target}",
+            f"curl -I http://{target}",
+            f"curl -I https://{target}"
+        ]),
+        ("🔧 Phase 3: Web Application Testing", "web_application_testing", "web_analysis",
+         "Analyze web application structure and technologies", [
+            f"curl -s http://{target}/robots.txt",
+            f"curl -s http://{target}/sitemap.xml",
+            f"whatweb http://{target}",
+            f"curl -s http://{target}/.well-known/security.txt"
+        ]),
+        ("📁 Phase 4: Content Discovery", "content_discovery", "directory_enumeration",
+         "Discover hidden files and directories", [
+            f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/admin",
+            f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/login",
+            f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/config",
+            f"curl -s -o /dev/null -w '%{{http_code}}' http://{target}/test"
+        ]),
+        ("🔍 Phase 5: Vulnerability Assessment", "vulnerability_assessment", "security_testing",
+         "Identify potential vulnerabilities", [
+            f"curl -s http://{target} | grep -i 'version'",
+            f"curl -s http://{target} | grep -i 'server'",
+            f"curl -H 'User-Agent: sqlmap' http://{target}",
+            f"curl -s http://{target}/search?q=<script>alert(1)</script>"
+        ]),
     ]
     
-    vuln_parallel = f"parallel_execute:{';'.join(vuln_commands)}"
-    
-    result5, code5, error5 = execute_command(
-        command=vuln_parallel,
-        phase="vulnerability_assessment",
-        tool_category="security_testing",
-        expected_outcome="Identify potential vulnerabilities"
-    )
+    print_colored(f"Using wordlist: {common_name}", Colors.YELLOW)
+    
+    def run_phase(phase):
+        title, phase_name, tool_category, expected_outcome, commands = phase
+        # Held back until the phase ends and written out under its title, so phases don't interleave
+        with thread_buffered_stdout():
+            print_colored(f"\n{title}", Colors.BLUE, bold=True)
+            execute_command(
+                commands=commands,
+                parallel=True,
+                phase=phase_name,
+                tool_category=tool_category,
+                expected_outcome=expected_outcome
+            )
+    
+    # Phases only wait on subprocesses, so threads are enough to overlap them
+    with ThreadPoolExecutor(max_workers=len(phases)) as pool:
+        list(pool.map(run_phase, phases))
     
     # Final Summary
-    print_colored("\n🎉 PENETRATION TESTING COMPLETE!", Colors.GREEN, bold=True)
-    print_colored("=" * 50, Colors.GREEN)
-    
-    print_colored("\n✅ TESTING SUMMARY:", Colors.CYAN, bold=True)
-    print_colored("   📊 5 phases completed successfully", Colors.GREEN)
-    print_colored("   🚀 All commands executed in parallel", Colors.GREEN)
-    print_colored("   📁 Wordlists properly integrated", Colors.GREEN)
-    print_colored("   🔍 Security findings automatically detected", Colors.GREEN)
-    print_colored("   📋 Results saved and organized", Colors.GREEN)
-    
-    print_colored("\n🎯 KEY CAPABILITIES VERIFIED:", Colors.CYAN, bold=True)
-    capabilities = [
-        "✅ Multi-terminal parallel execution",
-        "✅ Automatic wordlist management and download",
-        "✅ Real pentesting tool integration",
-        "✅ Security finding detection and analysis",
-        "✅ Professional result organization",
-        "✅ Non-blocking command execution",
-        "✅ Comprehensive error handling",
-        "✅ Automated wordlist path correction"
-    ]
-    
-    for capability in capabilities:
-        print_colored(f"   {capability}", Colors.GREEN)
-    
-    print_colored("\n🔥 PROJECT STATUS: FULLY OPERATIONAL! 🔥", Colors.RED, bold=True)
-    print_colored("Ready for professional penetration testing operations!", Colors.GREEN)
+    with buffered_stdout():
+        print_colored("\n🎉 PENETRATION TESTING COMPLETE!", Colors.GREEN, bold=True)
+        print_colored("=" * 50, Colors.GREEN)
+        
+        print_colored("\n✅ TESTING SUMMARY:", Colors.CYAN, bold=True)
+        print_colored("   📊 5 phases completed successfully", Colors.GREEN)
+        print_colored("   🚀 All commands executed in parallel", Colors.GREEN)
+        print_colored("   📁 Wordlists properly integrated", Colors.GREEN)
+        print_colored("   🔍 Security findings automatically detected", Colors.GREEN)
+        print_colored("   📋 Results saved and organized", Colors.GREEN)
+        
+        print_colored("\n🎯 KEY CAPABILITIES VERIFIED:", Colors.CYAN, bold=True)
+        capabilities = [
+            "✅ Multi-terminal parallel execution",
+            "✅ Automatic wordlist management and download",
+            "✅ Real pentesting tool integration",
+            "✅ Security finding detection and analysis",
+            "✅ Professional result organization",
+            "✅ Non-blocking command execution",
+            "✅ Comprehensive error handling",
+            "✅ Automated wordlist path correction"
+        ]
+        
+        for capability in capabilities:
+            print_colored(f"   {capability}", Colors.GREEN)
+        
+        print_colored("\n🔥 PROJECT STATUS: FULLY OPERATIONAL! 🔥", Colors.RED, bold=True)
+        print_colored("Ready for professional penetration testing operations!", Colors.GREEN)
 
 if __name__ == "__main__":
     test_complete_project()
@@ -5,8 +5,8 @@ Tests the complete AI Pentester Agent with proper wordlist management
 """
 
 import os
-import time
-from wordlist_manager import wordlist_manager, ensure_wordlists_ready, get_wordlist_for_tool
+import traceback
+from wordlist_manager import wordlist_manager, ensure_wordlists_ready, get_wordlist_for_tool, TOOL_PURPOSES
 from command_executor_v2 import execute_command
 from config import print_colored, Colors
 
@@ -29,16 +29,7 @@ def setup_wordlists():
     
     # Show tool-specific paths
     print_colored("🛠️  Tool-specific wordlist paths:", Colors.CYAN, bold=True)
-    tools_purposes = [
-        ("gobuster", "directory"),
-        ("gobuster", "subdomain"),
-        ("dirb", "directory"),
-        ("ffuf", "directory"),
-        ("hydra", "password"),
-        ("hydra", "username")
-    ]
-    
-    for tool, purpose in tools_purposes:
+    for tool, purpose in TOOL_PURPOSES:
         path = get_wordlist_for_tool(tool, purpose)
         exists = "✅" if os.path.exists(path) else "❌"
         print_colored(f"   {tool} ({purpose}): {exists} {path}", Colors.YELLOW)
@@ -96,17 +87,15 @@ def test_parallel_execution_with_wordlists():
         f"whatweb http://{target}"
     ]
     
-    parallel_recon = f"parallel_execute:{';'.join(recon_commands)}"
-    
     result, code, error = execute_command(
-        command=parallel_recon,
+        commands=recon_commands,
+        parallel=True,
         phase="enhanced_reconnaissance",
         tool_category="network_scanning",
         expected_outcome="Target discovery with proper tooling"
     )
     
     print()
-    time.sleep(2)
     
     # Phase 2: Directory enumeration with correct wordlists
     print_colored("🌐 Phase 2: Directory Enumeration with Wordlists", Colors.BLUE, bold=True)
@@ -119,17 +108,15 @@ def test_parallel_execution_with_wordlists():
         f"curl -s http://{target}/config"
     ]
     
-    parallel_dir = f"parallel_execute:{';'.join(dir_commands)}"
-    
     result, code, error = execute_command(
-        command=parallel_dir,
+        commands=dir_commands,
+        parallel=True,
         phase="directory_enumeration",
         tool_category="web_content_discovery",
         expected_outcome="Discover hidden directories and files"
     )
     
     print()
-    time.sleep(2)
     
     # Phase 3: Custom wordlist-based testing
     print_colored("🔧 Phase 3: Custom Wordlist Testing", Colors.BLUE, bold=True)
@@ -142,10 +129,9 @@ def test_parallel_execution_with_wordlists():
         f"echo 'Wordlist verification complete'"
     ]
     
-    parallel_custom = f"parallel_execute:{';'.join(custom_commands)}"
-    
     result, code, error = execute_command(
-        command=parallel_custom,
+        commands=custom_commands,
+        parallel=True,
         phase="wordlist_verification",
         tool_category="verification",
         expected_outcome="Verify wordlist accessibility and content"
@@ -193,7 +179,6 @@ def main():
         
     except Exception as e:
         print_colored(f"❌ Test failed: {e}", Colors.RED)
-        import traceback
         traceback.print_exc()
 
 if __name__ == "__main__":
@@ -1,30 +1,53 @@
 # autopentest_project/config.py
 
+import io
 import os
+import sys
+import json
+import shlex
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
-# Load environment variables from .env file if it exists
+# Load environment variables from .env file if it exists (once per process tree;
+# the sentinel is inherited by re-imports and by child processes)
 try:
     from dotenv import load_dotenv
-    env_path = Path(__file__).parent / '.env'
-    if env_path.exists():
-        load_dotenv(env_path)
-        print(f"✅ Loaded environment variables from {env_path}")
-    else:
-        print("ℹ️  No .env file found, using system environment variables")
+    if not os.environ.get("_AUTOPENTEST_DOTENV_LOADED"):
+        env_path = Path(__file__).parent / '.env'
+        if env_path.exists():
+            load_dotenv(env_path)
+            print(f"✅ Loaded environment variables from {env_path}")
+        else:
+            print("ℹ️  No .env file found, using system environment variables")
+        os.environ["_AUTOPENTEST_DOTENV_LOADED"] = "1"
 except ImportError:
-    print("⚠️  python-dotenv not installed. Install with: pip install python-dotenv")
-    print("   Using system environment variables only")
+    # Keep captured stdout of subprocesses clean; only warn an interactive user
+    if sys.stderr.isatty():
+        print("⚠️  python-dotenv not installed. Install with: pip install python-dotenv", file=sys.stderr)
+        print("   Using system environment variables only", file=sys.stderr)
+
+# orjson is optional; json_dumps falls back to the stdlib encoder without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- LLM Configuration ---
 # IMPORTANT: Set your GEMINI_API_KEY as an environment variable for security.
 # Example: export GEMINI_API_KEY="your_actual_api_key"
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 MODEL_NAME = "gemini-2.0-flash-lite" # Or your preferred Gemini model
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv("REDTEAM_GEMINI_RPM", "0")) # Client-side cap matching your API quota; 0 means no cap
 
 # --- Agent Configuration ---
 MAX_ITERATIONS = 15
 COMMAND_TIMEOUT_SECONDS = 120 # Timeout for individual commands
+MAX_PARALLEL_TASKS = int(os.getenv("REDTEAM_MAX_PARALLEL", "8")) # Cap on concurrently running parallel tasks
+NMAP_FAST_FLAGS = os.getenv("REDTEAM_NMAP_FLAGS", "-T4 -n --min-rate 5000 --min-hostgroup 64") # Keep nmap's probe pipe full and skip reverse DNS
+NMAP_FAST_ARGS = shlex.split(NMAP_FAST_FLAGS) # The same flags as argv entries, for commands run without a shell
+# Comma-separated DNS servers for enumeration, e.g. "1.1.1.1,8.8.8.8,9.9.9.9"; empty uses the system resolvers
+DNS_NAMESERVERS = [server.strip() for server in os.getenv("REDTEAM_DNS_SERVERS", "").split(",") if server.strip()]
 
 USER_COMMAND_APPROVAL = True  # Set to True to enable user approval, False for automatic execution
 
@@ -88,6 +111,9 @@ You MUST respond in valid JSON with these keys:
     "expected_outcome": "What you expect to discover or achieve",
     "next_steps": "Planned follow-up actions based on results"
 }
+Optionally add "commands": ["cmd1", "cmd2", ...] listing several INDEPENDENT commands
+(e.g. the same scan against different hosts) to run together in parallel; their results
+come back in one message. When "commands" is given, "command" is ignored.
 
 SPECIAL COMMANDS:
 - Use "custom_function:function_name:parameters" for custom Python functions
@@ -104,6 +130,7 @@ SECURITY GUIDELINES:
 
 Remember: You are conducting authorized security testing. Always provide educational value and actionable recommendations.
 """
+SYSTEM_INSTRUCTIONS = SYSTEM_INSTRUCTIONS.strip()  # Trim once here rather than per request
 
 # --- SUDO Password (EXTREMELY INSECURE - FOR DEMONSTRATION ONLY) ---
 # !! WARNING !! WARNING !! WARNING !!
@@ -113,29 +140,125 @@ Remember: You are conducting authorized security testing. Always provide educati
 SUDO_PASSWORD = os.getenv("SUDO_PASSWORD")  # Remove the hardcoded password
 
 # --- ANSI Color Codes for Beautiful Output ---
-class Colors:
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-
-    BLACK = "\033[30m"
-    RED = "\033[31m"
-    GREEN = "\033[32m"
-    YELLOW = "\033[33m"
-    BLUE = "\033[34m"
-    MAGENTA = "\033[35m"
-    CYAN = "\033[36m"
-    WHITE = "\033[37m"
-
-    LIGHTBLACK_EX = "\033[90m"
-    LIGHTRED_EX = "\033[91m"
-    LIGHTGREEN_EX = "\033[92m"
-    LIGHTYELLOW_EX = "\033[93m"
-    LIGHTBLUE_EX = "\033[94m"
-    LIGHTMAGENTA_EX = "\033[95m"
-    LIGHTCYAN_EX = "\033[96m"
-    LIGHTWHITE_EX = "\033[97m"
+RESET = "\033[0m"
+BOLD = "\033[1m"
+
+BLACK = "\033[30m"
+RED = "\033[31m"
+GREEN = "\033[32m"
+YELLOW = "\033[33m"
+BLUE = "\033[34m"
+MAGENTA = "\033[35m"
+CYAN = "\033[36m"
+WHITE = "\033[37m"
+
+LIGHTBLACK_EX = "\033[90m"
+LIGHTRED_EX = "\033[91m"
+LIGHTGREEN_EX = "\033[92m"
+LIGHTYELLOW_EX = "\033[93m"
+LIGHTBLUE_EX = "\033[94m"
+LIGHTMAGENTA_EX = "\033[95m"
+LIGHTCYAN_EX = "\033[96m"
+LIGHTWHITE_EX = "\033[97m"
+
+# Namespace alias so existing Colors.X lookups keep working
+Colors = sys.modules[__name__]
 
 # --- Helper for printing colored messages ---
-def print_colored(message, color=Colors.WHITE, bold=False):
-    prefix = Colors.BOLD if bold else ""
-    print(f"{prefix}{color}{message}{Colors.RESET}")
+# ANSI prefix per (color, bold) pair, filled on first use
+_PREFIX = {}
+
+def print_colored(message, color=WHITE, bold=False):
+    prefix = _PREFIX.get((color, bold))
+    if prefix is None:
+        prefix = _PREFIX[(color, bold)] = (BOLD if bold else "") + color
+    sys.stdout.write(prefix + str(message) + RESET + "\n")
+
+def print_colored_many(pairs):
+    """Print several (message, color) pairs with a single write"""
+    sys.stdout.write("".join(f"{color}{message}{RESET}\n" for message, color in pairs))
+
+# Redirected output (files, CI logs) or NO_COLOR (https://no-color.org): skip the ANSI codes
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    def print_colored(message, color=WHITE, bold=False):
+        sys.stdout.write(f"{message}\n")
+
+    def print_colored_many(pairs):
+        """Print several (message, color) pairs with a single write"""
+        sys.stdout.write("".join(f"{message}\n" for message, _ in pairs))
+
+@contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it out in one go"""
+    real = sys.stdout
+    buf = sys.stdout = io.StringIO()
+    try:
+        yield
+    finally:
+        sys.stdout = real
+        real.write(buf.getvalue())
+        real.flush()
+
+class _ThreadRoutedStdout:
+    """sys.stdout stand-in that sends each registered thread's writes to that thread's buffer"""
+    
+    def __init__(self, real):
+        self.real = real
+        self.buffers = {}
+    
+    def write(self, text):
+        return self.buffers.get(threading.get_ident(), self.real).write(text)
+    
+    def flush(self):
+        if threading.get_ident() not in self.buffers:
+            self.real.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.real, name)
+
+# The router installed as sys.stdout while any thread_buffered_stdout block is open, and how many are
+_routed_stdout = None
+_routed_users = 0
+_routed_lock = threading.Lock()
+
+@contextmanager
+def thread_buffered_stdout():
+    """buffered_stdout for the calling thread only, so concurrent workers each write out their own block"""
+    global _routed_stdout, _routed_users
+    buf = io.StringIO()
+    with _routed_lock:
+        if _routed_users == 0:
+            _routed_stdout = sys.stdout = _ThreadRoutedStdout(sys.stdout)
+        _routed_users += 1
+        router = _routed_stdout
+    router.buffers[threading.get_ident()] = buf
+    try:
+        yield
+    finally:
+        del router.buffers[threading.get_ident()]
+        with _routed_lock:
+            router.real.write(buf.getvalue())
+            router.real.flush()
+            _routed_users -= 1
+            if _routed_users == 0:
+                sys.stdout = router.real
+                _routed_stdout = None
+
+# --- Helper for JSON output returned to the agent ---
+def json_dumps(data) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits
+    return json.dumps(data, indent=2, default=str)
+
+def json_loads(text):
+    """Parse JSON from str or bytes, using orjson when it is installed.
+    
+    Raises json.JSONDecodeError either way (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
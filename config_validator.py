@@ -10,28 +10,40 @@ from config import Colors, print_colored
 class ConfigValidator:
     """Validates and manages configuration settings."""
     
-    REQUIRED_ENV_VARS = [
+    REQUIRED_ENV_VARS = frozenset({
         "GEMINI_API_KEY"
-    ]
+    })
     
-    OPTIONAL_ENV_VARS = [
+    OPTIONAL_ENV_VARS = frozenset({
         "SUDO_PASSWORD",
         "COMMAND_TIMEOUT_SECONDS",
         "MAX_ITERATIONS"
-    ]
+    })
     
-    def validate_environment(self) -> Tuple[bool, List[str]]:
-        """Validate environment variables and configuration."""
+    def validate_environment(self, strict: bool = False) -> Tuple[bool, List[str]]:
+        """Validate environment variables and configuration.
+        
+        With strict=True, stop at the first missing required variable and skip warnings.
+        """
         errors = []
         warnings = []
+        env = os.environ
+        
+        if strict:
+            for var in sorted(self.REQUIRED_ENV_VARS):
+                if not env.get(var):
+                    error = f"Missing required environment variable: {var}"
+                    print_colored(f"❌ {error}", Colors.RED, bold=True)
+                    return False, [error]
+            return True, []
         
         # Check required environment variables
-        for var in self.REQUIRED_ENV_VARS:
-            if not os.getenv(var):
+        for var in sorted(self.REQUIRED_ENV_VARS):
+            if not env.get(var):
                 errors.append(f"Missing required environment variable: {var}")
         
         # Check if API key looks valid (basic check)
-        api_key = os.getenv("GEMINI_API_KEY")
+        api_key = env.get("GEMINI_API_KEY")
         if api_key:
             if len(api_key) < 20:
                 warnings.append("GEMINI_API_KEY seems too short - may be invalid")
@@ -39,7 +51,7 @@ class ConfigValidator:
                 warnings.append("GEMINI_API_KEY doesn't match expected format")
         
         # Check sudo password warning
-        if os.getenv("SUDO_PASSWORD"):
+        if env.get("SUDO_PASSWORD"):
             warnings.append("SUDO_PASSWORD is set - this is a security risk")
         
         # Print results
@@ -65,17 +77,20 @@ class ConfigValidator:
         # Safe config items (non-sensitive)
         from config import MODEL_NAME, MAX_ITERATIONS, COMMAND_TIMEOUT_SECONDS, USER_COMMAND_APPROVAL
         
+        env = os.environ
+        api_key = env.get("GEMINI_API_KEY")
+        sudo_password = env.get("SUDO_PASSWORD")
+        
         config_items = [
-            ("Model Name", MODEL_NAME),
-            ("Max Iterations", MAX_ITERATIONS),
-            ("Command Timeout", f"{COMMAND_TIMEOUT_SECONDS}s"),
-            ("User Approval Required", "Yes" if USER_COMMAND_APPROVAL else "No"),
-            ("API Key Set", "Yes" if os.getenv("GEMINI_API_KEY") else "No"),
-            ("Sudo Password Set", "Yes" if os.getenv("SUDO_PASSWORD") else "No")
+            ("Model Name", MODEL_NAME, Colors.GREEN),
+            ("Max Iterations", MAX_ITERATIONS, Colors.GREEN),
+            ("Command Timeout", f"{COMMAND_TIMEOUT_SECONDS}s", Colors.GREEN),
+            ("User Approval Required", "Yes" if USER_COMMAND_APPROVAL else "No", Colors.GREEN if USER_COMMAND_APPROVAL else Colors.YELLOW),
+            ("API Key Set", "Yes" if api_key else "No", Colors.GREEN if api_key else Colors.YELLOW),
+            ("Sudo Password Set", "Yes" if sudo_password else "No", Colors.GREEN if sudo_password else Colors.YELLOW)
         ]
         
-        for key, value in config_items:
-            color = Colors.GREEN if "Yes" in str(value) or value else Colors.YELLOW
+        for key, value, color in config_items:
             print_colored(f"   {key:20}: {value}", color)
 
 # Global validator instance
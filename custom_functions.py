@@ -3,17 +3,79 @@
 Custom pentesting functions for specialized tasks.
 """
 
+import asyncio
 import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import dns.asyncresolver
 import dns.resolver
 import whois
-import subprocess
 import json
+import time
 import re
 import ipaddress
+from collections import Counter
 from urllib.parse import urlparse
 from typing import Dict, List, Any, Optional
-from config import Colors, print_colored
+from config import Colors, print_colored, print_colored_many, DNS_NAMESERVERS
+
+# Upper bound on simultaneous connection attempts in port_scan_basic
+PORT_SCAN_CONCURRENCY = 500
+# Upper bound on simultaneous ping processes in network_discovery
+PING_SWEEP_CONCURRENCY = 256
+# Seconds per DNS server attempt, and in total per query
+DNS_QUERY_TIMEOUT = 2
+DNS_QUERY_LIFETIME = 4
+# Seconds to keep DNS answers that carry no TTL of their own (plain host lookups)
+DNS_CACHE_DEFAULT_TTL = 300
+# Hosts and connections per host kept alive by the shared requests session
+HTTP_POOL_SIZE = 128
+# RDAP bootstrap service (redirects to the registry's RDAP server), and seconds to keep its answers
+RDAP_DOMAIN_URL = 'https://rdap.org/domain/{}'
+WHOIS_CACHE_TTL = 3600
+
+# Record types and subdomain prefixes queried by dns_enumeration
+DNS_RECORD_TYPES = ('A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME')
+COMMON_SUBDOMAINS = (
+    'www', 'mail', 'ftp', 'admin', 'api', 'dev', 'test', 'staging',
+    'blog', 'shop', 'portal', 'secure', 'vpn', 'remote'
+)
+
+# Response headers reported by web_technology_detection, in report order
+SECURITY_HEADERS = (
+    'x-frame-options', 'x-content-type-options', 'x-xss-protection',
+    'strict-transport-security', 'content-security-policy',
+    'x-powered-by', 'server'
+)
+
+# Body substrings that identify a web technology, matched case-insensitively
+TECH_PATTERNS = {
+    'WordPress': ('wp-content', 'wp-includes'),
+    'Drupal': ('drupal', '/sites/default/'),
+    'Joomla': ('joomla', '/components/com_'),
+    'Apache': ('apache',),
+    'Nginx': ('nginx',),
+    'PHP': ('php', '.php'),
+    'ASP.NET': ('asp.net', '__viewstate'),
+    'jQuery': ('jquery',),
+    'Bootstrap': ('bootstrap',)
+}
+
+# One group per technology; a match's technology is _TECH_NAMES[m.lastindex - 1]
+_TECH_NAMES = tuple(TECH_PATTERNS)
+_TECH_RE = re.compile(
+    "|".join("(" + "|".join(map(re.escape, patterns)) + ")" for patterns in TECH_PATTERNS.values()),
+    re.IGNORECASE
+)
+_FORM_RE = re.compile(r'<form[^>]*>(.*?)</form>', re.IGNORECASE | re.DOTALL)
+_DIR_LISTING_RE = re.compile(r'index of', re.IGNORECASE)
+_DEFAULT_PAGE_RE = re.compile(r'apache2 ubuntu default|welcome to nginx', re.IGNORECASE)
+
+# Bytes of a response body read for fingerprinting; the rest is not downloaded
+BODY_SCAN_LIMIT = 2 * 1024 * 1024
+# Seconds a fetched page is reused by the web analyses before it is requested again
+FETCH_CACHE_TTL = 300
 
 class CustomPentestingFunctions:
     """Custom functions for specialized pentesting tasks."""
@@ -23,29 +85,128 @@ class CustomPentestingFunctions:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
         })
+        # Keep-alive pool large enough for parallel scans; retry transient connection errors
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # (name, record type) -> (expiry timestamp, answer); entries live for the record TTL
+        self._dns_cache: Dict[tuple, tuple] = {}
+        # domain -> (expiry timestamp, whois_lookup results)
+        self._whois_cache: Dict[str, tuple] = {}
+        # url -> (expiry timestamp, (response, body text)); shared by the web analyses
+        self._fetch_cache: Dict[str, tuple] = {}
+        # One resolver for all enumeration, so resolv.conf is read once. Built on first use:
+        # this instance is created at import time, and hosts without resolv.conf can't build one.
+        # False once building it has failed.
+        self._resolver = None
+    
+    @staticmethod
+    def _make_resolver(nameservers: Optional[List[str]] = None):
+        """Async resolver that rotates across its nameservers with short per-query timeouts."""
+        # Explicit nameservers make the system configuration irrelevant, so don't require one
+        resolver = dns.asyncresolver.Resolver(configure=not nameservers)
+        if nameservers:
+            resolver.nameservers = list(nameservers)
+        resolver.rotate = True
+        resolver.timeout = DNS_QUERY_TIMEOUT
+        resolver.lifetime = DNS_QUERY_LIFETIME
+        return resolver
+    
+    def _shared_resolver(self):
+        """The enumeration resolver, or None where no resolver configuration is available."""
+        if self._resolver is None:
+            try:
+                self._resolver = self._make_resolver(DNS_NAMESERVERS)
+            except (dns.resolver.NoResolverConfiguration, OSError) as e:
+                print_colored(f"⚠️  No DNS resolver configuration ({e}); using system lookups for A records only", Colors.YELLOW)
+                self._resolver = False
+        return self._resolver or None
+    
+    def _cached_dns(self, key: tuple) -> Any:
+        """Return a cached, unexpired DNS answer or None."""
+        entry = self._dns_cache.get(key)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+        return None
+    
+    def _resolve_host(self, host: str) -> str:
+        """Resolve a hostname to an IPv4 address, reusing earlier lookups."""
+        address = self._cached_dns((host, 'HOST'))
+        if address is None:
+            address = socket.gethostbyname(host)
+            self._dns_cache[(host, 'HOST')] = (time.time() + DNS_CACHE_DEFAULT_TTL, address)
+        return address
     
     def port_scan_basic(self, target: str, ports: List[int], timeout: int = 1) -> Dict[int, bool]:
         """Basic TCP port scanning."""
         print_colored(f"🔍 Scanning {len(ports)} ports on {target}", Colors.CYAN)
-        results = {}
         
-        for port in ports:
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(timeout)
-                result = sock.connect_ex((target, port))
-                results[port] = result == 0
-                sock.close()
-                
-                if results[port]:
-                    print_colored(f"   ✅ Port {port}/tcp open", Colors.GREEN)
-                    
-            except Exception as e:
-                results[port] = False
-                print_colored(f"   ❌ Error scanning port {port}: {e}", Colors.RED)
+        try:
+            address = self._resolve_host(target)
+        except OSError as e:
+            print_colored(f"   ❌ Error resolving {target}: {e}", Colors.RED)
+            return {port: False for port in ports}
+        
+        results = asyncio.run(self._port_scan_async(address, ports, timeout))
+        
+        print_colored_many((f"   ✅ Port {port}/tcp open", Colors.GREEN) for port in ports if results[port])
         
         return results
     
+    async def _port_scan_async(self, address: str, ports: List[int], timeout: int) -> Dict[int, bool]:
+        """Probe all ports concurrently, at most PORT_SCAN_CONCURRENCY at a time."""
+        sem = asyncio.Semaphore(PORT_SCAN_CONCURRENCY)
+        
+        async def probe(port: int) -> bool:
+            async with sem:
+                try:
+                    _, writer = await asyncio.wait_for(asyncio.open_connection(address, port), timeout)
+                except (asyncio.TimeoutError, OSError):
+                    return False
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
+                return True
+        
+        open_flags = await asyncio.gather(*(probe(port) for port in ports))
+        return dict(zip(ports, open_flags))
+    
+    def _fetch_body(self, url: str) -> tuple:
+        """GET url and return (response, body text), reading at most BODY_SCAN_LIMIT bytes.
+        
+        The result is reused for FETCH_CACHE_TTL seconds, so technology detection and the
+        vulnerability checks on the same URL cost one request.
+        """
+        entry = self._fetch_cache.get(url)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+        
+        response = self.session.get(url, timeout=10, stream=True)
+        chunks = []
+        size = 0
+        try:
+            for chunk in response.iter_content(64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= BODY_SCAN_LIMIT:
+                    break
+        finally:
+            response.close()
+        body = b"".join(chunks)[:BODY_SCAN_LIMIT]
+        try:
+            content = body.decode(response.encoding or 'utf-8', errors='replace')
+        except LookupError:
+            content = body.decode('utf-8', errors='replace')
+        
+        self._fetch_cache[url] = (time.time() + FETCH_CACHE_TTL, (response, content))
+        return response, content
+    
     def web_technology_detection(self, url: str) -> Dict[str, Any]:
         """Detect web technologies and gather basic info."""
         print_colored(f"🌐 Analyzing web technologies for {url}", Colors.CYAN)
@@ -61,44 +222,26 @@ class CustomPentestingFunctions:
         }
         
         try:
-            response = self.session.get(url, timeout=10, allow_redirects=True)
+            response, content = self._fetch_body(url)
             results['status_code'] = response.status_code
             results['headers'] = dict(response.headers)
             
-            # Check for common technologies
-            content = response.text.lower()
-            tech_patterns = {
-                'WordPress': ['wp-content', 'wp-includes'],
-                'Drupal': ['drupal', '/sites/default/'],
-                'Joomla': ['joomla', '/components/com_'],
-                'Apache': ['apache'],
-                'Nginx': ['nginx'],
-                'PHP': ['php', '.php'],
-                'ASP.NET': ['asp.net', '__viewstate'],
-                'jQuery': ['jquery'],
-                'Bootstrap': ['bootstrap']
-            }
-            
-            for tech, patterns in tech_patterns.items():
-                if any(pattern in content for pattern in patterns):
-                    results['technologies'].append(tech)
+            # Check for common technologies (one case-insensitive pass over the body)
+            found = set()
+            for match in _TECH_RE.finditer(content):
+                found.add(match.lastindex - 1)
+                if len(found) == len(_TECH_NAMES):
+                    break
+            results['technologies'] = [_TECH_NAMES[i] for i in sorted(found)]
             
             # Security headers analysis
-            security_headers = [
-                'x-frame-options', 'x-content-type-options', 'x-xss-protection',
-                'strict-transport-security', 'content-security-policy',
-                'x-powered-by', 'server'
-            ]
-            
-            for header in security_headers:
+            for header in SECURITY_HEADERS:
                 value = response.headers.get(header)
                 if value:
                     results['security_headers'][header] = value
             
             # Basic form detection
-            form_pattern = r'<form[^>]*>(.*?)</form>'
-            forms = re.findall(form_pattern, content, re.IGNORECASE | re.DOTALL)
-            results['forms'] = len(forms)
+            results['forms'] = sum(1 for _ in _FORM_RE.finditer(content))
             
             print_colored(f"   ✅ Status: {results['status_code']}", Colors.GREEN)
             print_colored(f"   🔧 Technologies: {', '.join(results['technologies'])}", Colors.YELLOW)
@@ -109,7 +252,7 @@ class CustomPentestingFunctions:
         
         return results
     
-    def dns_enumeration(self, domain: str) -> Dict[str, Any]:
+    def dns_enumeration(self, domain: str, nameservers: Optional[List[str]] = None) -> Dict[str, Any]:
         """Comprehensive DNS enumeration."""
         print_colored(f"🔍 DNS enumeration for {domain}", Colors.CYAN)
         
@@ -124,58 +267,134 @@ class CustomPentestingFunctions:
             'subdomains': []
         }
         
-        record_types = ['A', 'AAAA', 'MX', 'NS', 'TXT', 'CNAME']
+        # Common subdomain enumeration
+        subdomain_names = [f"{subdomain}.{domain}" for subdomain in COMMON_SUBDOMAINS]
         
-        for record_type in record_types:
-            try:
-                answers = dns.resolver.resolve(domain, record_type)
-                records = [str(rdata) for rdata in answers]
-                results[f'{record_type.lower()}_records'] = records
-                print_colored(f"   ✅ {record_type}: {len(records)} records", Colors.GREEN)
-            except Exception:
-                print_colored(f"   ⚠️  No {record_type} records found", Colors.YELLOW)
+        # All queries are independent, so send them together and wait for the slowest
+        queries = [(domain, record_type) for record_type in DNS_RECORD_TYPES]
+        queries += [(full_domain, 'A') for full_domain in subdomain_names]
+        answers = asyncio.run(self._resolve_all_async(queries, nameservers))
         
-        # Common subdomain enumeration
-        common_subdomains = [
-            'www', 'mail', 'ftp', 'admin', 'api', 'dev', 'test', 'staging',
-            'blog', 'shop', 'portal', 'secure', 'vpn', 'remote'
-        ]
+        # Report lines are collected and written once rather than per record
+        lines = []
+        for record_type, answer in zip(DNS_RECORD_TYPES, answers):
+            if isinstance(answer, Exception):
+                lines.append((f"   ⚠️  No {record_type} records found", Colors.YELLOW))
+            else:
+                records = [str(rdata) for rdata in answer]
+                results[f'{record_type.lower()}_records'] = records
+                lines.append((f"   ✅ {record_type}: {len(records)} records", Colors.GREEN))
         
-        for subdomain in common_subdomains:
-            try:
-                full_domain = f"{subdomain}.{domain}"
-                dns.resolver.resolve(full_domain, 'A')
+        for full_domain, answer in zip(subdomain_names, answers[len(DNS_RECORD_TYPES):]):
+            if not isinstance(answer, Exception):
                 results['subdomains'].append(full_domain)
-                print_colored(f"   ✅ Found subdomain: {full_domain}", Colors.GREEN)
-            except:
-                pass
+                lines.append((f"   ✅ Found subdomain: {full_domain}", Colors.GREEN))
         
+        print_colored_many(lines)
         return results
     
+    async def _resolve_all_async(self, queries: List[tuple], nameservers: Optional[List[str]] = None) -> List[Any]:
+        """Resolve (name, record_type) pairs concurrently; failures are returned as exceptions."""
+        resolver = self._make_resolver(nameservers) if nameservers else self._shared_resolver()
+        
+        async def system_lookup(name: str, record_type: str) -> List[str]:
+            """A records through the system resolver; other types need a DNS resolver."""
+            if record_type != 'A':
+                raise dns.resolver.NoResolverConfiguration(f"no resolver for {record_type} queries")
+            infos = await asyncio.get_running_loop().getaddrinfo(name, None, family=socket.AF_INET, type=socket.SOCK_STREAM)
+            return sorted({info[4][0] for info in infos})
+        
+        async def resolve(name: str, record_type: str) -> Any:
+            # Answers from a custom nameserver are not mixed into the shared cache
+            if nameservers:
+                return await resolver.resolve(name, record_type)
+            answer = self._cached_dns((name, record_type))
+            if answer is None:
+                if resolver is None:
+                    answer = await system_lookup(name, record_type)
+                else:
+                    answer = await resolver.resolve(name, record_type)
+                expiry = getattr(answer, 'expiration', time.time() + DNS_CACHE_DEFAULT_TTL)
+                self._dns_cache[(name, record_type)] = (expiry, answer)
+            return answer
+        
+        return await asyncio.gather(
+            *(resolve(name, record_type) for name, record_type in queries),
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def _vcard_values(entity: Dict[str, Any], field: str) -> List[str]:
+        """Values of one field in an RDAP entity's jCard."""
+        vcard = entity.get('vcardArray') or ['vcard', []]
+        return [prop[3] for prop in vcard[1] if prop[0] == field and len(prop) > 3]
+    
+    def _rdap_lookup(self, domain: str) -> Dict[str, Any]:
+        """WHOIS data for a domain from RDAP (structured JSON over the shared session)."""
+        response = self.session.get(
+            RDAP_DOMAIN_URL.format(domain),
+            headers={'Accept': 'application/rdap+json'},
+            timeout=10
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        registrar = None
+        emails = []
+        for entity in data.get('entities', []):
+            if 'registrar' in entity.get('roles', []) and registrar is None:
+                names = self._vcard_values(entity, 'fn')
+                registrar = names[0] if names else None
+            emails.extend(self._vcard_values(entity, 'email'))
+        events = {event.get('eventAction'): event.get('eventDate') for event in data.get('events', [])}
+        
+        return {
+            'domain': domain,
+            'registrar': registrar,
+            'creation_date': events.get('registration'),
+            'expiration_date': events.get('expiration'),
+            'name_servers': [ns['ldhName'] for ns in data.get('nameservers', []) if 'ldhName' in ns],
+            'status': data.get('status', []),
+            'emails': emails
+        }
+    
+    def _whois_text_lookup(self, domain: str) -> Dict[str, Any]:
+        """WHOIS data for a domain from the registry's port-43 WHOIS server."""
+        w = whois.whois(domain)
+        return {
+            'domain': domain,
+            'registrar': w.registrar,
+            'creation_date': str(w.creation_date) if w.creation_date else None,
+            'expiration_date': str(w.expiration_date) if w.expiration_date else None,
+            'name_servers': w.name_servers if w.name_servers else [],
+            'status': w.status if w.status else [],
+            'emails': w.emails if w.emails else []
+        }
+    
     def whois_lookup(self, domain: str) -> Dict[str, Any]:
         """WHOIS information gathering."""
         print_colored(f"📋 WHOIS lookup for {domain}", Colors.CYAN)
         
-        try:
-            w = whois.whois(domain)
-            results = {
-                'domain': domain,
-                'registrar': w.registrar,
-                'creation_date': str(w.creation_date) if w.creation_date else None,
-                'expiration_date': str(w.expiration_date) if w.expiration_date else None,
-                'name_servers': w.name_servers if w.name_servers else [],
-                'status': w.status if w.status else [],
-                'emails': w.emails if w.emails else []
-            }
-            
-            print_colored(f"   ✅ Registrar: {results['registrar']}", Colors.GREEN)
-            print_colored(f"   📅 Creation: {results['creation_date']}", Colors.YELLOW)
-            
-            return results
-            
-        except Exception as e:
-            print_colored(f"   ❌ WHOIS lookup failed: {e}", Colors.RED)
-            return {'domain': domain, 'error': str(e)}
+        key = domain.lower()
+        entry = self._whois_cache.get(key)
+        if entry is not None and entry[0] > time.time():
+            results = entry[1]
+        else:
+            try:
+                try:
+                    results = self._rdap_lookup(domain)
+                except (requests.RequestException, ValueError, KeyError, IndexError, TypeError):
+                    # Not every TLD has an RDAP server yet
+                    results = self._whois_text_lookup(domain)
+            except Exception as e:
+                print_colored(f"   ❌ WHOIS lookup failed: {e}", Colors.RED)
+                return {'domain': domain, 'error': str(e)}
+            self._whois_cache[key] = (time.time() + WHOIS_CACHE_TTL, results)
+        
+        print_colored(f"   ✅ Registrar: {results['registrar']}", Colors.GREEN)
+        print_colored(f"   📅 Creation: {results['creation_date']}", Colors.YELLOW)
+        
+        return dict(results)
     
     def vulnerability_check_basic(self, url: str) -> Dict[str, Any]:
         """Basic vulnerability checks."""
@@ -189,9 +408,8 @@ class CustomPentestingFunctions:
         }
         
         try:
-            response = self.session.get(url, timeout=10)
+            response, content = self._fetch_body(url)
             headers = response.headers
-            content = response.text
             
             # Check for common security issues
             checks = {
@@ -200,8 +418,8 @@ class CustomPentestingFunctions:
                 'Missing X-XSS-Protection': 'x-xss-protection' not in headers,
                 'Server header disclosure': 'server' in headers,
                 'X-Powered-By disclosure': 'x-powered-by' in headers,
-                'Directory listing enabled': 'index of' in content.lower(),
-                'Default pages present': any(x in content.lower() for x in ['apache2 ubuntu default', 'welcome to nginx']),
+                'Directory listing enabled': _DIR_LISTING_RE.search(content) is not None,
+                'Default pages present': _DEFAULT_PAGE_RE.search(content) is not None,
                 'Potential SQL injection points': '?' in url and any(x in url.lower() for x in ['id=', 'user=', 'page=']),
                 'HTTP instead of HTTPS': url.startswith('http://'),
             }
@@ -235,23 +453,11 @@ class CustomPentestingFunctions:
         
         try:
             network = ipaddress.IPv4Network(network_range, strict=False)
+            hosts = [str(ip) for ip in network.hosts()]
+            alive = asyncio.run(self._ping_sweep_async(hosts))
             
-            for ip in network.hosts():
-                ip_str = str(ip)
-                try:
-                    # Simple ping check
-                    result = subprocess.run(
-                        ['ping', '-c', '1', '-W', '1000', ip_str],
-                        capture_output=True,
-                        timeout=2
-                    )
-                    
-                    if result.returncode == 0:
-                        live_hosts.append(ip_str)
-                        print_colored(f"   ✅ Host alive: {ip_str}", Colors.GREEN)
-                        
-                except:
-                    pass
+            live_hosts = [ip_str for ip_str, is_alive in zip(hosts, alive) if is_alive]
+            print_colored_many((f"   ✅ Host alive: {ip_str}", Colors.GREEN) for ip_str in live_hosts)
                     
         except Exception as e:
             print_colored(f"   ❌ Network discovery failed: {e}", Colors.RED)
@@ -259,11 +465,37 @@ class CustomPentestingFunctions:
         print_colored(f"   📊 Found {len(live_hosts)} live hosts", Colors.CYAN)
         return live_hosts
     
+    async def _ping_sweep_async(self, hosts: List[str]) -> List[bool]:
+        """Ping every host once, at most PING_SWEEP_CONCURRENCY at a time."""
+        sem = asyncio.Semaphore(PING_SWEEP_CONCURRENCY)
+        
+        async def ping(ip_str: str) -> bool:
+            async with sem:
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        'ping', '-c', '1', '-W', '1000', ip_str,
+                        stdout=asyncio.subprocess.DEVNULL,
+                        stderr=asyncio.subprocess.DEVNULL
+                    )
+                except OSError:
+                    return False
+                try:
+                    return await asyncio.wait_for(process.wait(), 2) == 0
+                except asyncio.TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    return False
+        
+        return await asyncio.gather(*(ping(ip_str) for ip_str in hosts))
+    
     def generate_report(self, findings: Dict[str, Any]) -> str:
         """Generate a comprehensive penetration testing report."""
         print_colored("📊 Generating penetration testing report...", Colors.CYAN, bold=True)
         
-        report = f"""
+        vulnerabilities = findings.get('vulnerabilities', [])
+        severity_counts = Counter(v.get('severity') for v in vulnerabilities)
+        
+        parts = [f"""
 PENETRATION TESTING REPORT
 {'=' * 50}
 
@@ -276,24 +508,24 @@ Executive Summary:
 {findings.get('executive_summary', 'Comprehensive security assessment performed.')}
 
 Findings Summary:
-- Critical: {len([f for f in findings.get('vulnerabilities', []) if f.get('severity') == 'Critical'])}
-- High: {len([f for f in findings.get('vulnerabilities', []) if f.get('severity') == 'High'])}
-- Medium: {len([f for f in findings.get('vulnerabilities', []) if f.get('severity') == 'Medium'])}
-- Low: {len([f for f in findings.get('vulnerabilities', []) if f.get('severity') == 'Low'])}
+- Critical: {severity_counts['Critical']}
+- High: {severity_counts['High']}
+- Medium: {severity_counts['Medium']}
+- Low: {severity_counts['Low']}
 
 Detailed Findings:
-"""
+"""]
         
-        for i, vuln in enumerate(findings.get('vulnerabilities', []), 1):
-            report += f"""
+        for i, vuln in enumerate(vulnerabilities, 1):
+            parts.append(f"""
 {i}. {vuln.get('title', 'Vulnerability')}
    Severity: {vuln.get('severity', 'Unknown')}
    Description: {vuln.get('description', 'No description')}
    Recommendation: {vuln.get('recommendation', 'Review and remediate')}
    
-"""
+""")
         
-        report += f"""
+        parts.append(f"""
 Technical Details:
 {findings.get('technical_details', 'See individual command outputs for technical details.')}
 
@@ -304,9 +536,9 @@ Tools Used:
 {chr(10).join([f"- {tool}" for tool in findings.get('tools_used', [])])}
 
 Report Generated by: AutoPentest AI Agent
-"""
+""")
         
-        return report
+        return "".join(parts)
 
 # Global custom functions instance
 custom_functions = CustomPentestingFunctions()
@@ -3,12 +3,39 @@
 Enhanced logging module for the AI Pentester Agent.
 """
 
+import atexit
 import logging
-import json
+import logging.handlers
+import queue
 import datetime
+import hashlib
 from pathlib import Path
 from typing import Dict, Any
-from config import Colors, print_colored
+from config import Colors, print_colored, json_dumps
+
+# Records waiting to be written per log file; beyond this the oldest are dropped
+LOG_QUEUE_SIZE = 10000
+
+# Characters of command output kept per iteration in the session summary
+ITERATION_OUTPUT_CHARS = 1000
+
+class DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks the caller: when full, the oldest record is dropped."""
+    
+    def prepare(self, record):
+        # Formatting is left to the listener thread
+        return record
+    
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
 
 class EnhancedLogger:
     """Enhanced logging with structured data and security events."""
@@ -35,28 +62,43 @@ class EnhancedLogger:
             "iterations": [],
             "security_events": []
         }
+        # sha256 of (event type, command, details) -> its entry in security_events
+        self._security_event_index: Dict[bytes, Dict[str, Any]] = {}
     
     def _setup_loggers(self):
         """Setup structured logging."""
         # Session logger
         self.session_logger = logging.getLogger("session")
         self.session_logger.setLevel(logging.INFO)
-        session_handler = logging.FileHandler(self.session_log)
+        session_handler = logging.FileHandler(self.session_log, delay=True)
         session_formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s'
         )
         session_handler.setFormatter(session_formatter)
-        self.session_logger.addHandler(session_handler)
         
         # Security logger
         self.security_logger = logging.getLogger("security")
         self.security_logger.setLevel(logging.WARNING)
-        security_handler = logging.FileHandler(self.security_log)
+        security_handler = logging.FileHandler(self.security_log, delay=True)
         security_formatter = logging.Formatter(
             '%(asctime)s - SECURITY - %(levelname)s - %(message)s'
         )
         security_handler.setFormatter(security_formatter)
-        self.security_logger.addHandler(security_handler)
+        
+        # Both loggers are called on the agent/command hot path, so the file
+        # writes happen on background listener threads instead of in the caller
+        self.file_handlers = {
+            self.session_logger: session_handler,
+            self.security_logger: security_handler
+        }
+        self.listeners = []
+        for logger, file_handler in self.file_handlers.items():
+            log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            self.listeners.append(listener)
+            logger.addHandler(DropOldestQueueHandler(log_queue))
     
     def log_objective(self, objective: str):
         """Log the initial objective."""
@@ -72,7 +114,7 @@ class EnhancedLogger:
             "timestamp": datetime.datetime.now().isoformat(),
             "thought": thought,
             "command": command,
-            "output": output[:1000],  # Truncate long outputs
+            "output": output if len(output) <= ITERATION_OUTPUT_CHARS else output[:ITERATION_OUTPUT_CHARS] + "…[truncated]",
             "return_code": return_code,
             "user_approved": approved
         }
@@ -81,15 +123,26 @@ class EnhancedLogger:
         self.session_logger.info(f"ITERATION {iteration}: Command='{command}', RC={return_code}, Approved={approved}")
     
     def log_security_event(self, event_type: str, command: str, details: str):
-        """Log security-related events."""
-        security_event = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "event_type": event_type,
-            "command": command,
-            "details": details
-        }
+        """Log security-related events.
+        
+        Repeats of an event already in the session summary only bump its occurrence count.
+        """
+        key = hashlib.sha256(f"{event_type}\0{command}\0{details}".encode()).digest()
+        security_event = self._security_event_index.get(key)
+        if security_event is not None:
+            security_event["occurrences"] += 1
+            security_event["last_seen"] = datetime.datetime.now().isoformat()
+        else:
+            security_event = {
+                "timestamp": datetime.datetime.now().isoformat(),
+                "event_type": event_type,
+                "command": command,
+                "details": details,
+                "occurrences": 1
+            }
+            self._security_event_index[key] = security_event
+            self.session_data["security_events"].append(security_event)
         
-        self.session_data["security_events"].append(security_event)
         self.security_logger.warning(f"{event_type}: {command} - {details}")
         print_colored(f"🔒 Security Event: {event_type} - {details}", Colors.RED)
     
@@ -98,8 +151,7 @@ class EnhancedLogger:
         self.session_data["end_time"] = datetime.datetime.now().isoformat()
         
         summary_file = self.log_dir / f"summary_{self.session_data['session_id']}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(self.session_data, f, indent=2)
+        summary_file.write_text(json_dumps(self.session_data), encoding='utf-8')
         
         print_colored(f"📊 Session summary saved to: {summary_file}", Colors.GREEN)
         return str(summary_file)
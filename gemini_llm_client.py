@@ -2,107 +2,30 @@
 
 import google.generativeai as genai
 # from google.generativeai import types # We might not need explicit types import this way
+import atexit
+import datetime
+import hashlib
 import json
-import re
-from config import Colors, print_colored
-
-def parse_llm_response_json(response_text: str) -> dict:
-    """
-    Extracts the enhanced pentesting response from the model's JSON response.
-    Handles potential ```json ... ``` markdown and other noise.
-    """
-    action = {
-        "thought": "Error: LLM response was empty or unparseable.", 
-        "command": "",
-        "phase": "unknown",
-        "tool_category": "unknown",
-        "expected_outcome": "Unknown",
-        "next_steps": "Review error and retry"
-    }
-    
-    try:
-        # Attempt to find JSON block within markdown
-        match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
-        if match:
-            json_text = match.group(1).strip()
-        else:
-            # If no markdown, assume the whole text might be JSON or contain it
-            json_text = response_text.strip()
-
-        # Try to find the first '{' and last '}' to extract a valid JSON object
-        first_brace = json_text.find('{')
-        last_brace = json_text.rfind('}')
-
-        if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-            json_text_to_parse = json_text[first_brace : last_brace + 1]
-            try:
-                parsed_action = json.loads(json_text_to_parse)
-                
-                # Validate required keys for enhanced format
-                required_keys = ["thought", "command"]
-                if all(key in parsed_action for key in required_keys):
-                    # Update with parsed values, keeping defaults for missing optional keys
-                    for key in ["thought", "command", "phase", "tool_category", "expected_outcome", "next_steps"]:
-                        if key in parsed_action:
-                            action[key] = parsed_action[key]
-                else:
-                    action["thought"] = "Error: LLM response JSON missing required keys."
-                    print_colored(f"[LLM Client] Required keys missing. Raw: {json_text_to_parse}", Colors.RED)
-                    
-            except json.JSONDecodeError as e_inner:
-                action["thought"] = f"Error: Failed to decode JSON from extracted text: {e_inner}. Raw: {json_text_to_parse}"
-                print_colored(f"[LLM Client] JSONDecodeError on extracted text: {e_inner}. Raw: {json_text_to_parse}", Colors.RED)
-                fallback_cmd = extract_fallback_command(response_text)
-                if fallback_cmd and fallback_cmd != "exit":
-                     action["command"] = fallback_cmd
-                     action["thought"] = "Fallback: JSON parsing failed, extracted command directly."
-                elif fallback_cmd == "exit":
-                    if "command" not in action or action["command"].lower() != "exit":
-                        action["command"] = "exit"
-                        action["thought"] = "Fallback: JSON parsing failed, but 'exit' keyword found."
-        else:
-            action["thought"] = "Error: No valid JSON object found in LLM response."
-            print_colored(f"[LLM Client] No clear JSON object found. Raw: {json_text}", Colors.RED)
-            fallback_cmd = extract_fallback_command(response_text)
-            if fallback_cmd:
-                 action["command"] = fallback_cmd
-                 action["thought"] = "Fallback: No JSON, extracted command directly."
-
-    except Exception as e:
-        action["thought"] = f"Error: Unexpected error parsing LLM response: {str(e)}. Raw: {response_text}"
-        print_colored(f"[LLM Client] Unexpected parsing error: {e}. Raw: {response_text}", Colors.RED)
-        fallback_cmd = extract_fallback_command(response_text)
-        if fallback_cmd:
-            action["command"] = fallback_cmd
-            action["thought"] = "Fallback: Exception during JSON parse, extracted command directly."
-
-    return action
-
-def extract_fallback_command(response_text: str) -> str:
-    """
-    Fallback to extract command if JSON parsing fails.
-    Looks for ```bash ... ``` or assumes the first non-empty line is a command.
-    """
-    pattern = r"```bash\s*(.*?)\s*```"
-    match = re.search(pattern, response_text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-
-    stripped_response = response_text.strip().lower()
-    if stripped_response == "exit" or stripped_response.startswith("exit "):
-        return "exit"
-
-    lines = [line.strip() for line in response_text.splitlines() if line.strip()]
-    if lines:
-        potential_command = lines[0]
-        if len(potential_command.split()) < 15 and len(potential_command) < 200:
-            if not potential_command.lower().startswith(("i think", "the next step", "my thought", "based on", "error:")):
-                return potential_command
-    return ""
-
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Optional
+from config import Colors, print_colored, json_dumps, json_loads, GEMINI_REQUESTS_PER_MINUTE
+from llm_response_parser import parse_llm_response_json, extract_fallback_command
+
+# User-model exchanges kept in the conversation history
+MAX_HISTORY_TURNS = 10
+# How long the server keeps the cached system instructions alive between calls
+CONTEXT_CACHE_TTL = datetime.timedelta(hours=1)
+# Smallest prompt the API accepts as cached content; shorter instructions are sent inline
+CONTEXT_CACHE_MIN_TOKENS = 32768
+# Replies kept in the on-disk response cache; the oldest are dropped first
+RESPONSE_CACHE_MAX_ENTRIES = 500
 
 class GeminiClient:
-    def __init__(self, api_key: str, system_instructions: str, model_name: str):
+    def __init__(self, api_key: str, system_instructions: str, model_name: str,
+                 response_cache_file: Optional[str] = None):
         if not api_key:
             print_colored("API Key for Gemini is not configured. Please set the GEMINI_API_KEY environment variable.", Colors.RED, bold=True)
             raise ValueError("Gemini API Key is missing.")
@@ -111,20 +34,107 @@ class GeminiClient:
         self.model_name = model_name
         # Store system instructions to be used with GenerativeModel
         self.system_instructions_text = system_instructions
-        self.conversation_history = [] # List of {'role': 'user'/'model', 'parts': ['text']} dicts
+        # {'role': 'user'/'model', 'parts': ['text']} dicts; the oldest pair drops off once full
+        self.conversation_history = deque(maxlen=MAX_HISTORY_TURNS * 2)
+        # Exact-match reply cache: digest of (model, instructions, history, input) -> reply text
+        self.response_cache_file = Path(response_cache_file) if response_cache_file else None
+        self.response_cache = self._load_response_cache()
+        # Start times of the requests in the last minute, for the client-side rate limit
+        self._request_times = deque(maxlen=GEMINI_REQUESTS_PER_MINUTE or None)
+        self._rate_lock = threading.Lock()
 
         # Initialize the model here
+        self.cached_content = self._cache_system_instructions()
         try:
-            self.model = genai.GenerativeModel(
-                model_name=self.model_name,
-                system_instruction=self.system_instructions_text
-                # generation_config can be set here too if needed globally
-                # safety_settings can be set here too
-            )
+            if self.cached_content is not None:
+                self.model = genai.GenerativeModel.from_cached_content(cached_content=self.cached_content)
+            else:
+                self.model = genai.GenerativeModel(
+                    model_name=self.model_name,
+                    system_instruction=self.system_instructions_text
+                    # generation_config can be set here too if needed globally
+                    # safety_settings can be set here too
+                )
         except Exception as e:
             print_colored(f"Failed to initialize GenerativeModel: {e}", Colors.RED, bold=True)
             raise
 
+    def _cache_system_instructions(self):
+        """
+        Registers the system instructions as server-side cached content, so the
+        shared prefix is processed once per session instead of on every call.
+        Returns None when caching is unavailable (older SDK, or a prompt below
+        CONTEXT_CACHE_MIN_TOKENS) and the instructions are sent inline.
+        The cache is deleted again when the interpreter exits.
+        """
+        caching = getattr(genai, "caching", None)
+        if caching is None:
+            return None
+        try:
+            token_count = genai.GenerativeModel(self.model_name).count_tokens(self.system_instructions_text).total_tokens
+            if token_count < CONTEXT_CACHE_MIN_TOKENS:
+                return None
+            cached_content = caching.CachedContent.create(
+                model=self.model_name,
+                system_instruction=self.system_instructions_text,
+                ttl=CONTEXT_CACHE_TTL
+            )
+        except Exception as e:
+            print_colored(f"[LLM Client] Context caching unavailable, sending system instructions inline: {e}", Colors.LIGHTBLACK_EX)
+            return None
+        atexit.register(self._delete_cached_content, cached_content)
+        return cached_content
+
+    @staticmethod
+    def _delete_cached_content(cached_content):
+        # Otherwise the cache lingers, and is billed, until its TTL runs out
+        try:
+            cached_content.delete()
+        except Exception:
+            pass
+
+
+    def _load_response_cache(self) -> dict:
+        if self.response_cache_file is None:
+            return {}
+        try:
+            cache = json_loads(self.response_cache_file.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _cache_key(self, user_input: str) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model_name, self.system_instructions_text, *(turn['parts'][0] for turn in self.conversation_history), user_input):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _store_response(self, key: str, response_text: str):
+        self.response_cache[key] = response_text
+        while len(self.response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            del self.response_cache[next(iter(self.response_cache))]
+        if self.response_cache_file is not None:
+            try:
+                self.response_cache_file.write_text(json_dumps(self.response_cache), encoding="utf-8")
+            except OSError as e:
+                print_colored(f"[LLM Client] Could not save response cache: {e}", Colors.YELLOW)
+
+    def _wait_for_rate_limit(self):
+        """
+        Blocks until another request fits in the GEMINI_REQUESTS_PER_MINUTE window,
+        so bursts are spread out instead of failing with a quota error.
+        Safe to call from several threads.
+        """
+        if not GEMINI_REQUESTS_PER_MINUTE:
+            return
+        with self._rate_lock:
+            if len(self._request_times) == GEMINI_REQUESTS_PER_MINUTE:
+                wait = self._request_times[0] + 60 - time.monotonic()
+                if wait > 0:
+                    print_colored(f"[LLM Client] Request quota reached, waiting {wait:.1f}s...", Colors.LIGHTBLACK_EX)
+                    time.sleep(wait)
+            self._request_times.append(time.monotonic())
 
     def send_message(self, user_input: str) -> str:
         """
@@ -134,29 +144,29 @@ class GeminiClient:
         print_colored(f"\n[LLM Client] Sending to Gemini:", Colors.LIGHTBLUE_EX)
         print_colored(f"  User Input: {user_input[:200]}...", Colors.LIGHTBLACK_EX)
 
-        # Add current user message to history
-        self.conversation_history.append({'role': 'user', 'parts': [user_input]})
+        cache_key = self._cache_key(user_input)
+        response_text = self.response_cache.get(cache_key)
+        if response_text is not None:
+            # Same conversation seen before (e.g. a repeated objective): reuse the reply
+            self.conversation_history.append({'role': 'user', 'parts': [user_input]})
+            self.conversation_history.append({'role': 'model', 'parts': [response_text]})
+            print_colored("[LLM Client] Reusing cached Gemini response.", Colors.LIGHTBLUE_EX)
+            return response_text
 
+        self._wait_for_rate_limit()
         try:
             # Create a new chat session for each call if model is stateless or to ensure context
             # For multi-turn, we pass the whole history.
-            chat_session = self.model.start_chat(history=self.conversation_history[:-1]) # Pass history *before* current user input
+            chat_session = self.model.start_chat(history=list(self.conversation_history)) # History *before* current user input
             response = chat_session.send_message(user_input) # Send only the current user input
 
             response_text = response.text.strip() # Access text directly
 
-            # Update conversation history with model's response
+            # Record the exchange only once it succeeded, as a pair, so the
+            # history always starts with a 'user' turn after old pairs drop off
+            self.conversation_history.append({'role': 'user', 'parts': [user_input]})
             self.conversation_history.append({'role': 'model', 'parts': [response_text]})
-
-            # Optional: Limit history size
-            max_history_turns = 10 # Keep last 10 user-model exchanges (20 items)
-            if len(self.conversation_history) > max_history_turns * 2:
-                # Trim from the beginning, but keep at least one user/model pair if possible
-                # Ensure we don't create an empty history or a history starting with 'model'
-                # A more robust way is to ensure we always have pairs or start with 'user'
-                # For simplicity here, just slicing:
-                self.conversation_history = self.conversation_history[-(max_history_turns * 2):]
-
+            self._store_response(cache_key, response_text)
 
             print_colored(f"[LLM Client] Received from Gemini:", Colors.LIGHTBLUE_EX)
             # print_colored(f"  Raw Response: {response_text[:300]}...", Colors.LIGHTBLACK_EX)
@@ -164,10 +174,6 @@ class GeminiClient:
 
         except Exception as e:
             print_colored(f"[LLM Client] Error communicating with Gemini API: {e}", Colors.RED, bold=True)
-            # Attempt to remove the last user message if call failed, to avoid resending on retry
-            if self.conversation_history and self.conversation_history[-1]['role'] == 'user':
-                self.conversation_history.pop()
-
             # Log more details if available
             if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
                  print_colored(f"  Prompt Feedback: {response.prompt_feedback}", Colors.YELLOW)
@@ -176,11 +182,11 @@ class GeminiClient:
                  if response.candidates[0].safety_ratings:
                      print_colored(f"  Safety Ratings: {response.candidates[0].safety_ratings}", Colors.YELLOW)
 
-            return json.dumps({
+            return json_dumps({
                 "thought": f"Critical Error: Failed to get response from LLM API: {str(e)}. Cannot proceed.",
                 "command": "exit"
             })
 
     def clear_history(self):
-        self.conversation_history = []
+        self.conversation_history.clear()
         print_colored("[LLM Client] Conversation history cleared.", Colors.YELLOW)
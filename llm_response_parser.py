@@ -0,0 +1,144 @@
+# autopentest_project/llm_response_parser.py
+"""
+Parsing of model responses into agent actions.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from config import Colors, print_colored, json_loads
+
+# Fenced blocks in model responses
+_JSON_BLOCK_RE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+_BASH_BLOCK_RE = re.compile(r"```bash\s*(.*?)\s*```", re.DOTALL)
+
+# Characters that matter when scanning for a balanced JSON object
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
+@dataclass(frozen=True)
+class LlmAction:
+    """One parsed model response; defaults describe an unparseable reply."""
+    thought: str = "Error: LLM response was empty or unparseable."
+    command: str = ""
+    phase: str = "unknown"
+    tool_category: str = "unknown"
+    expected_outcome: str = "Unknown"
+    next_steps: str = "Review error and retry"
+    # Independent commands to run as one parallel batch, if the model proposed several
+    commands: Tuple[str, ...] = ()
+
+def _first_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} object in text, ignoring braces inside strings."""
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    pos = start
+    while True:
+        match = _JSON_SCAN_RE.search(text, pos)
+        if match is None:
+            return None
+        char = match.group()
+        pos = match.end()
+        if in_string:
+            if char == '\\':
+                pos += 1  # Skip the escaped character
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:pos]
+
+def parse_llm_response_json(response_text: str) -> LlmAction:
+    """
+    Extracts the enhanced pentesting response from the model's JSON response.
+    Handles potential ```json ... ``` markdown and other noise.
+    """
+    action: dict = {}
+    
+    try:
+        # Attempt to find JSON block within markdown
+        match = _JSON_BLOCK_RE.search(response_text)
+        if match:
+            json_text = match.group(1).strip()
+        else:
+            # If no markdown, assume the whole text might be JSON or contain it
+            json_text = response_text.strip()
+
+        # Extract the first balanced {...} object
+        json_text_to_parse = _first_json_object(json_text)
+
+        if json_text_to_parse is not None:
+            try:
+                parsed_action = json_loads(json_text_to_parse)
+                
+                # Validate required keys for enhanced format
+                required_keys = ["thought", "command"]
+                if all(key in parsed_action for key in required_keys):
+                    # Update with parsed values, keeping defaults for missing optional keys
+                    for key in ["thought", "command", "phase", "tool_category", "expected_outcome", "next_steps"]:
+                        if key in parsed_action:
+                            action[key] = parsed_action[key]
+                    commands = parsed_action.get("commands")
+                    if isinstance(commands, list):
+                        action["commands"] = tuple(c for c in commands if isinstance(c, str))
+                else:
+                    action["thought"] = "Error: LLM response JSON missing required keys."
+                    print_colored(f"[LLM Client] Required keys missing. Raw: {json_text_to_parse}", Colors.RED)
+                    
+            except json.JSONDecodeError as e_inner:
+                action["thought"] = f"Error: Failed to decode JSON from extracted text: {e_inner}. Raw: {json_text_to_parse}"
+                print_colored(f"[LLM Client] JSONDecodeError on extracted text: {e_inner}. Raw: {json_text_to_parse}", Colors.RED)
+                fallback_cmd = extract_fallback_command(response_text)
+                if fallback_cmd and fallback_cmd != "exit":
+                     action["command"] = fallback_cmd
+                     action["thought"] = "Fallback: JSON parsing failed, extracted command directly."
+                elif fallback_cmd == "exit":
+                    if action.get("command", "").lower() != "exit":
+                        action["command"] = "exit"
+                        action["thought"] = "Fallback: JSON parsing failed, but 'exit' keyword found."
+        else:
+            action["thought"] = "Error: No valid JSON object found in LLM response."
+            print_colored(f"[LLM Client] No clear JSON object found. Raw: {json_text}", Colors.RED)
+            fallback_cmd = extract_fallback_command(response_text)
+            if fallback_cmd:
+                 action["command"] = fallback_cmd
+                 action["thought"] = "Fallback: No JSON, extracted command directly."
+
+    except Exception as e:
+        action["thought"] = f"Error: Unexpected error parsing LLM response: {str(e)}. Raw: {response_text}"
+        print_colored(f"[LLM Client] Unexpected parsing error: {e}. Raw: {response_text}", Colors.RED)
+        fallback_cmd = extract_fallback_command(response_text)
+        if fallback_cmd:
+            action["command"] = fallback_cmd
+            action["thought"] = "Fallback: Exception during JSON parse, extracted command directly."
+
+    return LlmAction(**action)
+
+def extract_fallback_command(response_text: str) -> str:
+    """
+    Fallback to extract command if JSON parsing fails.
+    Looks for ```bash ... ``` or assumes the first non-empty line is a command.
+    """
+    match = _BASH_BLOCK_RE.search(response_text)
+    if match:
+        return match.group(1).strip()
+
+    stripped_response = response_text.strip().lower()
+    if stripped_response == "exit" or stripped_response.startswith("exit "):
+        return "exit"
+
+    lines = [line.strip() for line in response_text.splitlines() if line.strip()]
+    if lines:
+        potential_command = lines[0]
+        if len(potential_command.split()) < 15 and len(potential_command) < 200:
+            if not potential_command.lower().startswith(("i think", "the next step", "my thought", "based on", "error:")):
+                return potential_command
+    return ""
@@ -1,27 +1,87 @@
 # autopentest_project/main_agent.py
 
+import random
+import re
 import sys
 import datetime
-from typing import Union
+from typing import Optional, Union
 from config import (
     GEMINI_API_KEY, SYSTEM_INSTRUCTIONS, MODEL_NAME, MAX_ITERATIONS,
-    USER_COMMAND_APPROVAL, Colors, print_colored, SUDO_PASSWORD
+    USER_COMMAND_APPROVAL, Colors, print_colored, print_colored_many, SUDO_PASSWORD
 )
 from gemini_llm_client import GeminiClient, parse_llm_response_json
 from command_executor import execute_command
 from security_validator import validator
 from enhanced_logger import enhanced_logger
 from config_validator import config_validator
+from session_manager import session_manager
 from pentesting_tools import tools_manager
 
+# Classifies a proposed command in one match: m.lastgroup is "special", "exit", or None for a shell command
+_COMMAND_KIND_RE = re.compile(r'(?P<special>custom_function:|install_tool:|report_generation)|\s*(?P<exit>(?i:exit))\s*$')
+
+# Characters of command output fed back to the LLM: long outputs keep their head and tail,
+# plus a sample of whole lines from the middle
+PROMPT_OUTPUT_HEAD_CHARS = 2000
+PROMPT_OUTPUT_TAIL_CHARS = 8000
+PROMPT_OUTPUT_SAMPLE_CHARS = 1000
+
+def output_for_prompt(output: str) -> str:
+    """Bound command output for the next prompt; the middle of long tool output is only sampled."""
+    if len(output) <= PROMPT_OUTPUT_HEAD_CHARS + PROMPT_OUTPUT_TAIL_CHARS:
+        return output
+    middle = output[PROMPT_OUTPUT_HEAD_CHARS:-PROMPT_OUTPUT_TAIL_CHARS].splitlines()
+    
+    # Seeded by the output length so the same output always gives the same prompt
+    order = list(range(len(middle)))
+    random.Random(len(output)).shuffle(order)
+    picked = []
+    budget = PROMPT_OUTPUT_SAMPLE_CHARS
+    for index in order:
+        budget -= len(middle[index]) + 1
+        if budget < 0:
+            break
+        picked.append(index)
+    sample = "\n".join(middle[index] for index in sorted(picked))
+    
+    omitted = len(output) - PROMPT_OUTPUT_HEAD_CHARS - PROMPT_OUTPUT_TAIL_CHARS - len(sample)
+    return (f"{output[:PROMPT_OUTPUT_HEAD_CHARS]}\n"
+            f"…[{omitted} characters omitted; sampled lines from the middle follow]…\n"
+            f"{sample}\n"
+            f"…[end of sample]…\n"
+            f"{output[-PROMPT_OUTPUT_TAIL_CHARS:]}")
+
+# Static parts of the welcome screen, each written with a single print_colored_many call
+_WELCOME_BANNER = (
+    ("==============================================", Colors.BOLD + Colors.MAGENTA),
+    ("    AutoPentest AI Agent v2.0               ", Colors.BOLD + Colors.MAGENTA),
+    ("    Professional Pentesting Framework       ", Colors.BOLD + Colors.MAGENTA),
+    ("==============================================", Colors.BOLD + Colors.MAGENTA),
+    ("Powered by Google Gemini + Real Pentesting Tools", Colors.LIGHTBLUE_EX),
+    ("Comprehensive Security Assessment Framework", Colors.LIGHTBLUE_EX),
+    ("", Colors.WHITE)
+)
+_WELCOME_MENU = (
+    ("", Colors.WHITE),
+    ("🔒 SECURITY MODE: User approval required for all commands", Colors.BOLD + Colors.LIGHTGREEN_EX)
+    if USER_COMMAND_APPROVAL else
+    ("⚡ AUTO MODE: Commands execute automatically (HIGH RISK)", Colors.BOLD + Colors.LIGHTRED_EX),
+    ("", Colors.WHITE),
+    ("📋 AVAILABLE METHODOLOGIES:", Colors.BOLD + Colors.CYAN),
+    ("   • Reconnaissance & Information Gathering", Colors.LIGHTYELLOW_EX),
+    ("   • Network & Service Enumeration", Colors.LIGHTYELLOW_EX),
+    ("   • Vulnerability Assessment", Colors.LIGHTYELLOW_EX),
+    ("   • Web Application Testing", Colors.LIGHTYELLOW_EX),
+    ("   • Custom Function Integration", Colors.LIGHTYELLOW_EX),
+    ("", Colors.WHITE),
+    ("🔧 SPECIAL COMMANDS:", Colors.BOLD + Colors.CYAN),
+    ("   • custom_function:function_name:params", Colors.LIGHTWHITE_EX),
+    ("   • install_tool:tool_name", Colors.LIGHTWHITE_EX),
+    ("   • report_generation", Colors.LIGHTWHITE_EX)
+)
+
 def display_welcome_message():
-    print_colored("==============================================", Colors.MAGENTA, bold=True)
-    print_colored("    AutoPentest AI Agent v2.0               ", Colors.MAGENTA, bold=True)
-    print_colored("    Professional Pentesting Framework       ", Colors.MAGENTA, bold=True)
-    print_colored("==============================================", Colors.MAGENTA, bold=True)
-    print_colored("Powered by Google Gemini + Real Pentesting Tools", Colors.LIGHTBLUE_EX)
-    print_colored("Comprehensive Security Assessment Framework", Colors.LIGHTBLUE_EX)
-    print_colored("", Colors.WHITE)
+    print_colored_many(_WELCOME_BANNER)
     
     # Validate configuration
     is_valid, issues = config_validator.validate_environment()
@@ -32,31 +92,13 @@ def display_welcome_message():
     config_validator.print_config_summary()
     
     # Check pentesting tools
-    print_colored("", Colors.WHITE)
+    sys.stdout.write("\n")
     tools_manager.check_all_tools()
     
-    print_colored("", Colors.WHITE)
-    if USER_COMMAND_APPROVAL:
-        print_colored("🔒 SECURITY MODE: User approval required for all commands", Colors.LIGHTGREEN_EX, bold=True)
-    else:
-        print_colored("⚡ AUTO MODE: Commands execute automatically (HIGH RISK)", Colors.LIGHTRED_EX, bold=True)
-    
-    print_colored("", Colors.WHITE)
-    print_colored("📋 AVAILABLE METHODOLOGIES:", Colors.CYAN, bold=True)
-    print_colored("   • Reconnaissance & Information Gathering", Colors.LIGHTYELLOW_EX)
-    print_colored("   • Network & Service Enumeration", Colors.LIGHTYELLOW_EX)
-    print_colored("   • Vulnerability Assessment", Colors.LIGHTYELLOW_EX)
-    print_colored("   • Web Application Testing", Colors.LIGHTYELLOW_EX)
-    print_colored("   • Custom Function Integration", Colors.LIGHTYELLOW_EX)
-    
-    print_colored("", Colors.WHITE)
-    print_colored("🔧 SPECIAL COMMANDS:", Colors.CYAN, bold=True)
-    print_colored("   • custom_function:function_name:params", Colors.LIGHTWHITE_EX)
-    print_colored("   • install_tool:tool_name", Colors.LIGHTWHITE_EX)
-    print_colored("   • report_generation", Colors.LIGHTWHITE_EX)
+    print_colored_many(_WELCOME_MENU)
     
     if SUDO_PASSWORD:
-        print_colored("", Colors.WHITE)
+        sys.stdout.write("\n")
         print_colored("!! SECURITY WARNING !!", Colors.RED, bold=True)
         print_colored("Sudo password configured - Use only in isolated environments", Colors.RED)
     
@@ -115,7 +157,12 @@ def get_user_approval_for_command(command_to_run: str) -> tuple[bool, Union[str,
             print_colored("Invalid choice. Please enter Y, N, R, or Q.", Colors.RED)
 #highlight_end
 
-def main():
+def main(generate_report: Optional[bool] = None):
+    """
+    Runs one agent session.
+    generate_report decides the final report without prompting; when None the
+    user is asked, or the report is skipped if stdin is not a terminal.
+    """
     display_welcome_message()
 
     if not GEMINI_API_KEY:
@@ -130,7 +177,8 @@ def main():
         llm_client = GeminiClient(
             api_key=GEMINI_API_KEY,
             system_instructions=SYSTEM_INSTRUCTIONS,
-            model_name=MODEL_NAME
+            model_name=MODEL_NAME,
+            response_cache_file=session_manager.base_sessions_dir / "llm_response_cache.json"
         )
     except ValueError as e:
         print_colored(f"Failed to initialize LLM Client: {e}", Colors.RED, bold=True)
@@ -142,153 +190,177 @@ def main():
 
     current_llm_input = f"My objective is: '{initial_objective}'.\n" \
                         "I have not run any commands yet. What is your first thought and command to start working towards this objective?"
-    session_log = [f"Objective: {initial_objective}\n"]
-
-    for i in range(1, MAX_ITERATIONS + 1):
-        print_colored(f"\n=============== Iteration {i}/{MAX_ITERATIONS} ===============", Colors.MAGENTA, bold=True)
-
-        llm_response_text = llm_client.send_message(current_llm_input)
-
-        if not llm_response_text:
-            print_colored("[Agent] LLM returned an empty response. Aborting.", Colors.RED, bold=True)
-            session_log.append("LLM returned an empty response. Aborted.")
-            break
-
-        action = parse_llm_response_json(llm_response_text)
-        thought = action.get("thought", "Error: No thought provided by LLM.")
-        command_to_run = action.get("command", "")
-        phase = action.get("phase", "unknown")
-        tool_category = action.get("tool_category", "unknown")
-        expected_outcome = action.get("expected_outcome", "Unknown")
-        next_steps = action.get("next_steps", "Continue assessment")
-
-        print_colored("\n[LLM Analysis]", Colors.YELLOW, bold=True)
-        print_colored(f"💭 Thought: {thought}", Colors.LIGHTYELLOW_EX)
-        print_colored(f"🔍 Phase: {phase}", Colors.LIGHTCYAN_EX)
-        print_colored(f"🛠️  Tool Category: {tool_category}", Colors.LIGHTMAGENTA_EX)
-        print_colored(f"🎯 Expected Outcome: {expected_outcome}", Colors.LIGHTBLUE_EX)
-        
-        session_log.append(f"\n--- Iteration {i} ---\n")
-        session_log.append(f"LLM Thought: {thought}\n")
-        session_log.append(f"Phase: {phase}\n")
-        session_log.append(f"Tool Category: {tool_category}\n")
-        session_log.append(f"Expected: {expected_outcome}\n")
-
-        if not command_to_run:
-            print_colored("[Agent] LLM did not provide a command in the current step.", Colors.YELLOW)
-            current_llm_input = (
-                f"You did not provide a command in your last response. "
-                f"Your thought was: '{thought}'. "
-                f"Please provide a command to proceed with the objective: '{initial_objective}', or type 'exit' in the command field if you are done or stuck."
-            )
-            session_log.append("LLM Action: No command provided.\n")
-            continue
-
-        print_colored("\n[Proposed Command]", Colors.CYAN, bold=True)
-        
-        # Check if it's a special command
-        if command_to_run.startswith(("custom_function:", "install_tool:", "report_generation")):
-            print_colored(f"🔧 Special Command: {command_to_run}", Colors.LIGHTMAGENTA_EX)
-        else:
-            print_colored(f"💻 Shell Command: $ {command_to_run}", Colors.LIGHTWHITE_EX)
-            
-            # Security validation for shell commands
-            is_safe, risk_level, warnings = validator.validate_command(command_to_run)
-            validator.print_validation_result(command_to_run, is_safe, risk_level, warnings)
+    # The traditional session log is streamed to disk as the session runs
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file = f"autopentest_session_{timestamp}.log"
+    # Closed (and its buffer flushed) however the loop ends, including on errors and Ctrl-C
+    with open(log_file, "w", encoding="utf-8", buffering=1 << 16) as session_log:
+        session_log.write(f"Objective: {initial_objective}\n")
+
+        for i in range(1, MAX_ITERATIONS + 1):
+            print_colored(f"\n=============== Iteration {i}/{MAX_ITERATIONS} ===============", Colors.MAGENTA, bold=True)
+
+            llm_response_text = llm_client.send_message(current_llm_input)
+
+            if not llm_response_text:
+                print_colored("[Agent] LLM returned an empty response. Aborting.", Colors.RED, bold=True)
+                session_log.write("LLM returned an empty response. Aborted.")
+                break
+
+            action = parse_llm_response_json(llm_response_text)
+            thought = action.thought
+            command_to_run = action.command
+            phase = action.phase
+            tool_category = action.tool_category
+            expected_outcome = action.expected_outcome
+            next_steps = action.next_steps
+            # Independent commands proposed together run as one parallel batch and are analysed in one reply
+            # A "commands" list replaces "command"; a single entry is just an ordinary command
+            batch_commands = [c for c in action.commands if c.strip()]
+            if len(batch_commands) > 1:
+                command_to_run = "parallel_execute:" + ";".join(batch_commands)
+            else:
+                if batch_commands:
+                    command_to_run = batch_commands[0]
+                batch_commands = None
+
+            print_colored("\n[LLM Analysis]", Colors.YELLOW, bold=True)
+            print_colored(f"💭 Thought: {thought}", Colors.LIGHTYELLOW_EX)
+            print_colored(f"🔍 Phase: {phase}", Colors.LIGHTCYAN_EX)
+            print_colored(f"🛠️  Tool Category: {tool_category}", Colors.LIGHTMAGENTA_EX)
+            print_colored(f"🎯 Expected Outcome: {expected_outcome}", Colors.LIGHTBLUE_EX)
             
-            if not is_safe:
-                print_colored("🚫 Command blocked by security validator", Colors.RED, bold=True)
+            session_log.write(f"\n--- Iteration {i} ---\n")
+            session_log.write(f"LLM Thought: {thought}\n")
+            session_log.write(f"Phase: {phase}\n")
+            session_log.write(f"Tool Category: {tool_category}\n")
+            session_log.write(f"Expected: {expected_outcome}\n")
+
+            if not command_to_run:
+                print_colored("[Agent] LLM did not provide a command in the current step.", Colors.YELLOW)
                 current_llm_input = (
-                    f"The command '{command_to_run}' was BLOCKED by security validation due to safety concerns. "
-                    f"Please provide an alternative, safer command to achieve the objective: '{initial_objective}'."
+                    f"You did not provide a command in your last response. "
+                    f"Your thought was: '{thought}'. "
+                    f"Please provide a command to proceed with the objective: '{initial_objective}', or type 'exit' in the command field if you are done or stuck."
                 )
+                session_log.write("LLM Action: No command provided.\n")
                 continue
-        
-        session_log.append(f"LLM Command: {command_to_run}\n")
-
-        if command_to_run.strip().lower() == "exit":
-            print_colored("\n==============================================", Colors.GREEN, bold=True)
-            print_colored("    LLM has requested to EXIT.             ", Colors.GREEN, bold=True)
-            print_colored("==============================================", Colors.GREEN, bold=True)
-            print_colored("\nFinal Report from LLM:", Colors.LIGHTGREEN_EX, bold=True)
-            print_colored(thought, Colors.LIGHTGREEN_EX)
-            session_log.append(f"\nLLM Exited. Final Report:\n{thought}\n")
-            break
-
-        #highlight_start
-        execute_this_command = True
-        user_feedback_for_llm = None
-
-        if USER_COMMAND_APPROVAL:
-            approved, feedback_msg = get_user_approval_for_command(command_to_run)
-            if approved:
-                print_colored("[User Interaction] Command Approved for execution.", Colors.GREEN)
-                session_log.append("User Action: Approved command.\n")
-            else:
-                execute_this_command = False
-                user_feedback_for_llm = feedback_msg # This will be sent to LLM
-                print_colored(f"[User Interaction] Command Rejected. Feedback to LLM: {feedback_msg}", Colors.YELLOW)
-                session_log.append(f"User Action: Rejected command. Feedback: {feedback_msg}\n")
-        else:
-            # If approval is not needed, we can still log that it was auto-approved or simply proceed
-            session_log.append("User Action: Command auto-approved (approval disabled).\n")
 
-
-        if execute_this_command:
-            cmd_output, cmd_rc, cmd_timed_out = execute_command(command_to_run)
+            print_colored("\n[Proposed Command]", Colors.CYAN, bold=True)
             
-            # Log the iteration with enhanced data
-            enhanced_logger.log_iteration(i, thought, command_to_run, cmd_output, cmd_rc, True)
+            kind_match = _COMMAND_KIND_RE.match(command_to_run)
+            command_kind = kind_match.lastgroup if kind_match else "shell"
             
-            session_log.append(f"Command Output (RC: {cmd_rc}, Timed Out: {cmd_timed_out}):\n{cmd_output}\n")
+            # Check if it's a special command
+            if command_kind == "special":
+                print_colored(f"🔧 Special Command: {command_to_run}", Colors.LIGHTMAGENTA_EX)
+            else:
+                print_colored(f"💻 Shell Command: $ {command_to_run}", Colors.LIGHTWHITE_EX)
+                
+                # Security validation for shell commands
+                is_safe, risk_level, warnings = validator.validate_command(command_to_run)
+                validator.print_validation_result(command_to_run, is_safe, risk_level, warnings)
+                
+                if not is_safe:
+                    print_colored("🚫 Command blocked by security validator", Colors.RED, bold=True)
+                    current_llm_input = (
+                        f"The command '{command_to_run}' was BLOCKED by security validation due to safety concerns. "
+                        f"Please provide an alternative, safer command to achieve the objective: '{initial_objective}'."
+                    )
+                    continue
             
-            # Enhanced feedback based on command type and results
-            if cmd_timed_out:
-                current_llm_input = (
-                    f"The command '{command_to_run}' TIMED OUT.\n"
-                    f"Phase: {phase}, Tool Category: {tool_category}\n"
-                    f"Expected Outcome: {expected_outcome}\n"
-                    f"Output (if any) before timeout:\n{cmd_output}\n\n"
-                    f"Analyze this timeout and decide on the next step for the objective: '{initial_objective}'. "
-                    f"Consider if the command needs modification, a different timeout, or if an alternative approach is better. "
-                    f"Next planned steps were: {next_steps}"
-                )
-            elif cmd_rc != 0:
-                current_llm_input = (
-                    f"The command '{command_to_run}' FAILED with return code {cmd_rc}.\n"
-                    f"Phase: {phase}, Tool Category: {tool_category}\n"
-                    f"Expected Outcome: {expected_outcome}\n"
-                    f"Output/Error:\n{cmd_output}\n\n"
-                    f"Analyze this failure and decide on the next step for the objective: '{initial_objective}'. "
-                    f"You might need to try a different command, correct the previous one, or change your approach. "
-                    f"Consider the planned next steps: {next_steps}"
-                )
+            session_log.write(f"LLM Command: {command_to_run}\n")
+
+            if command_kind == "exit":
+                print_colored("\n==============================================", Colors.GREEN, bold=True)
+                print_colored("    LLM has requested to EXIT.             ", Colors.GREEN, bold=True)
+                print_colored("==============================================", Colors.GREEN, bold=True)
+                print_colored("\nFinal Report from LLM:", Colors.LIGHTGREEN_EX, bold=True)
+                print_colored(thought, Colors.LIGHTGREEN_EX)
+                session_log.write(f"\nLLM Exited. Final Report:\n{thought}\n")
+                break
+
+            #highlight_start
+            execute_this_command = True
+            user_feedback_for_llm = None
+
+            if USER_COMMAND_APPROVAL:
+                approved, feedback_msg = get_user_approval_for_command(command_to_run)
+                if approved:
+                    print_colored("[User Interaction] Command Approved for execution.", Colors.GREEN)
+                    session_log.write("User Action: Approved command.\n")
+                else:
+                    execute_this_command = False
+                    user_feedback_for_llm = feedback_msg # This will be sent to LLM
+                    print_colored(f"[User Interaction] Command Rejected. Feedback to LLM: {feedback_msg}", Colors.YELLOW)
+                    session_log.write(f"User Action: Rejected command. Feedback: {feedback_msg}\n")
             else:
+                # If approval is not needed, we can still log that it was auto-approved or simply proceed
+                session_log.write("User Action: Command auto-approved (approval disabled).\n")
+
+
+            if execute_this_command:
+                if batch_commands:
+                    cmd_output, cmd_rc, cmd_timed_out = execute_command(
+                        commands=batch_commands, parallel=True, phase=phase,
+                        tool_category=tool_category, expected_outcome=expected_outcome
+                    )
+                else:
+                    cmd_output, cmd_rc, cmd_timed_out = execute_command(command_to_run)
+                
+                # Log the iteration with enhanced data
+                enhanced_logger.log_iteration(i, thought, command_to_run, cmd_output, cmd_rc, True)
+                
+                session_log.write(f"Command Output (RC: {cmd_rc}, Timed Out: {cmd_timed_out}):\n{cmd_output}\n")
+                
+                # Enhanced feedback based on command type and results
+                prompt_output = output_for_prompt(cmd_output)
+                if cmd_timed_out:
+                    current_llm_input = (
+                        f"The command '{command_to_run}' TIMED OUT.\n"
+                        f"Phase: {phase}, Tool Category: {tool_category}\n"
+                        f"Expected Outcome: {expected_outcome}\n"
+                        f"Output (if any) before timeout:\n{prompt_output}\n\n"
+                        f"Analyze this timeout and decide on the next step for the objective: '{initial_objective}'. "
+                        f"Consider if the command needs modification, a different timeout, or if an alternative approach is better. "
+                        f"Next planned steps were: {next_steps}"
+                    )
+                elif cmd_rc != 0:
+                    current_llm_input = (
+                        f"The command '{command_to_run}' FAILED with return code {cmd_rc}.\n"
+                        f"Phase: {phase}, Tool Category: {tool_category}\n"
+                        f"Expected Outcome: {expected_outcome}\n"
+                        f"Output/Error:\n{prompt_output}\n\n"
+                        f"Analyze this failure and decide on the next step for the objective: '{initial_objective}'. "
+                        f"You might need to try a different command, correct the previous one, or change your approach. "
+                        f"Consider the planned next steps: {next_steps}"
+                    )
+                else:
+                    current_llm_input = (
+                        f"The command '{command_to_run}' executed SUCCESSFULLY (return code {cmd_rc}).\n"
+                        f"Phase: {phase}, Tool Category: {tool_category}\n"
+                        f"Expected Outcome: {expected_outcome}\n"
+                        f"Actual Output:\n{prompt_output}\n\n"
+                        f"Analyze this output and determine if the expected outcome was achieved. "
+                        f"Based on this result, what is your next thought and command to achieve the objective: '{initial_objective}'? "
+                        f"Continue with the planned next steps: {next_steps}"
+                    )
+            else: # Command was rejected by user
+                enhanced_logger.log_iteration(i, thought, command_to_run, "Command rejected by user", -1, False)
                 current_llm_input = (
-                    f"The command '{command_to_run}' executed SUCCESSFULLY (return code {cmd_rc}).\n"
+                    f"The previously suggested command ('{command_to_run}') was REJECTED by the user.\n"
                     f"Phase: {phase}, Tool Category: {tool_category}\n"
                     f"Expected Outcome: {expected_outcome}\n"
-                    f"Actual Output:\n{cmd_output}\n\n"
-                    f"Analyze this output and determine if the expected outcome was achieved. "
-                    f"Based on this result, what is your next thought and command to achieve the objective: '{initial_objective}'? "
-                    f"Continue with the planned next steps: {next_steps}"
+                    f"User feedback: {user_feedback_for_llm}\n\n"
+                    f"Please analyze this feedback and provide a new thought and command to achieve the objective: '{initial_objective}'. "
+                    f"Consider alternative approaches for the {phase} phase using {tool_category} tools."
                 )
-        else: # Command was rejected by user
-            enhanced_logger.log_iteration(i, thought, command_to_run, "Command rejected by user", -1, False)
-            current_llm_input = (
-                f"The previously suggested command ('{command_to_run}') was REJECTED by the user.\n"
-                f"Phase: {phase}, Tool Category: {tool_category}\n"
-                f"Expected Outcome: {expected_outcome}\n"
-                f"User feedback: {user_feedback_for_llm}\n\n"
-                f"Please analyze this feedback and provide a new thought and command to achieve the objective: '{initial_objective}'. "
-                f"Consider alternative approaches for the {phase} phase using {tool_category} tools."
-            )
-        #highlight_end
-
-    else:
-        print_colored(f"\n[Agent] Reached maximum iterations ({MAX_ITERATIONS}). Ending session.", Colors.YELLOW, bold=True)
-        session_log.append(f"Reached maximum iterations ({MAX_ITERATIONS}). Aborted.")
-        print_colored("Consider increasing MAX_ITERATIONS or refining the objective if more steps are needed.", Colors.YELLOW)
+            #highlight_end
+
+        else:
+            print_colored(f"\n[Agent] Reached maximum iterations ({MAX_ITERATIONS}). Ending session.", Colors.YELLOW, bold=True)
+            session_log.write(f"Reached maximum iterations ({MAX_ITERATIONS}). Aborted.")
+            print_colored("Consider increasing MAX_ITERATIONS or refining the objective if more steps are needed.", Colors.YELLOW)
 
 
     print_colored("\n==============================================", Colors.BLUE, bold=True)
@@ -302,21 +374,17 @@ def main():
     except Exception as e:
         print_colored(f"\n⚠️  Could not save session summary: {e}", Colors.YELLOW)
 
-    # Save traditional session log
-    try:
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        log_file = f"autopentest_session_{timestamp}.log"
-        with open(log_file, "w", encoding="utf-8") as f:
-            f.write("".join(session_log))
-        print_colored(f"📝 Traditional session log saved: {log_file}", Colors.GREEN)
-    except IOError as e:
-        print_colored(f"\n⚠️  Could not save session log: {e}", Colors.YELLOW)
+    print_colored(f"📝 Traditional session log saved: {log_file}", Colors.GREEN)
 
     # Offer to generate final report
     print_colored("\n🎯 Assessment Complete!", Colors.GREEN, bold=True)
-    print_colored("Would you like to generate a comprehensive penetration testing report? (y/n): ", Colors.CYAN, bold=False)
-    choice = input().strip().lower()
-    if choice == 'y':
+    if generate_report is None:
+        if sys.stdin.isatty():
+            print_colored("Would you like to generate a comprehensive penetration testing report? (y/n): ", Colors.CYAN, bold=False)
+            generate_report = input().strip().lower() == 'y'
+        else:
+            generate_report = False
+    if generate_report:
         try:
             # Execute report generation
             report_output, _, _ = execute_command("report_generation")
@@ -6,7 +6,7 @@ Enhanced main entry point with automatic session management
 
 import sys
 import argparse
-from config import print_colored, Colors
+from config import print_colored, print_colored_many, Colors
 from session_manager import session_manager, start_new_session, list_recent_sessions
 from main_agent import main as original_main
 from wordlist_manager import ensure_wordlists_ready
@@ -25,31 +25,35 @@ def show_session_status():
     """Show current session status"""
     stats = session_manager.get_session_stats()
     
-    print_colored("📊 SESSION STATUS", Colors.YELLOW, bold=True)
-    print_colored(f"   Total Sessions: {stats['total_sessions']}", Colors.LIGHTWHITE_EX)
-    print_colored(f"   Current Session Files: {stats['current_session_files']}", Colors.LIGHTWHITE_EX)
-    print_colored(f"   Disk Usage: {stats['disk_usage_mb']} MB", Colors.LIGHTWHITE_EX)
-    
-    if session_manager.session_id:
-        print_colored(f"   Active Session: {session_manager.session_id}", Colors.GREEN)
-    else:
-        print_colored("   No active session", Colors.YELLOW)
-    
-    print()
+    print_colored_many((
+        ("📊 SESSION STATUS", Colors.BOLD + Colors.YELLOW),
+        (f"   Total Sessions: {stats['total_sessions']}", Colors.LIGHTWHITE_EX),
+        (f"   Current Session Files: {stats['current_session_files']}", Colors.LIGHTWHITE_EX),
+        (f"   Disk Usage: {stats['disk_usage_mb']} MB", Colors.LIGHTWHITE_EX),
+        (f"   Active Session: {session_manager.session_id}", Colors.GREEN)
+        if session_manager.session_id else
+        ("   No active session", Colors.YELLOW),
+        ("", Colors.WHITE)
+    ))
+
+# Session menu lines, written with a single print_colored_many call per prompt
+_MENU_LINES = (
+    ("\n🎛️  SESSION MANAGEMENT MENU", Colors.BOLD + Colors.CYAN),
+    ("=" * 40, Colors.CYAN),
+    ("1. Start New Session", Colors.YELLOW),
+    ("2. List Recent Sessions", Colors.YELLOW),
+    ("3. Restore Previous Session", Colors.YELLOW),
+    ("4. Show Session Status", Colors.YELLOW),
+    ("5. Clean Old Sessions", Colors.YELLOW),
+    ("6. Start Pentesting (Current Session)", Colors.GREEN),
+    ("0. Exit", Colors.RED),
+    ("", Colors.WHITE)
+)
 
 def interactive_menu():
     """Interactive menu for session management"""
     while True:
-        print_colored("\n🎛️  SESSION MANAGEMENT MENU", Colors.CYAN, bold=True)
-        print_colored("=" * 40, Colors.CYAN)
-        print_colored("1. Start New Session", Colors.YELLOW)
-        print_colored("2. List Recent Sessions", Colors.YELLOW)
-        print_colored("3. Restore Previous Session", Colors.YELLOW)
-        print_colored("4. Show Session Status", Colors.YELLOW)
-        print_colored("5. Clean Old Sessions", Colors.YELLOW)
-        print_colored("6. Start Pentesting (Current Session)", Colors.GREEN)
-        print_colored("0. Exit", Colors.RED)
-        print()
+        print_colored_many(_MENU_LINES)
         
         choice = input("Select option: ").strip()
         
@@ -163,8 +167,8 @@ def main():
     print()
     
     try:
-        # Call the original main agent
-        original_main()
+        # Call the original main agent; auto-started sessions always end with the report
+        original_main(generate_report=True if args.auto_start else None)
         
     except KeyboardInterrupt:
         print_colored("\n🛑 Session interrupted by user", Colors.YELLOW)
@@ -4,21 +4,22 @@ AI Pentester Agent - Multi-Terminal Demo
 Complete demonstration of parallel pentesting capabilities
 """
 
-import time
 import json
-from command_executor_v2 import execute_command, get_parallel_results_summary
-from config import print_colored, Colors
+from command_executor_v2 import execute_command, execute_argv, get_parallel_results_summary
+from config import print_colored, buffered_stdout, Colors, NMAP_FAST_FLAGS, NMAP_FAST_ARGS
+from multi_terminal_integration import resolve_target, curl_resolve_args, quick_open_ports
 
 def main_demo():
     """Main demonstration of multi-terminal parallel execution"""
     
-    print_colored("🤖 AI PENTESTER AGENT - MULTI-TERMINAL DEMO", Colors.CYAN, bold=True)
-    print_colored("=" * 60, Colors.CYAN)
-    print()
-    print_colored("🎯 This demo shows how to run multiple pentesting commands", Colors.YELLOW)
-    print_colored("   simultaneously while the main script continues execution", Colors.YELLOW)
-    print_colored("   and automatically collects and analyzes results.", Colors.YELLOW)
-    print()
+    with buffered_stdout():
+        print_colored("🤖 AI PENTESTER AGENT - MULTI-TERMINAL DEMO", Colors.CYAN, bold=True)
+        print_colored("=" * 60, Colors.CYAN)
+        print()
+        print_colored("🎯 This demo shows how to run multiple pentesting commands", Colors.YELLOW)
+        print_colored("   simultaneously while the main script continues execution", Colors.YELLOW)
+        print_colored("   and automatically collects and analyzes results.", Colors.YELLOW)
+        print()
     
     # Demo 1: Basic parallel execution
     print_colored("📋 DEMO 1: Basic Parallel Commands", Colors.CYAN, bold=True)
@@ -37,9 +38,6 @@ def main_demo():
     print_colored("✅ Basic demo completed!", Colors.GREEN)
     print()
     
-    # Wait a moment
-    time.sleep(1)
-    
     # Demo 2: Real pentesting scenario
     print_colored("📋 DEMO 2: Real Pentesting Scenario", Colors.CYAN, bold=True)
     print_colored("-" * 40, Colors.CYAN)
@@ -49,30 +47,39 @@ def main_demo():
     
     # Reconnaissance phase
     print_colored("\n🔍 Phase 1: Reconnaissance", Colors.BLUE, bold=True)
-    recon_commands = f"parallel_execute:nmap -sS -T4 -p 80,443,22,21 {target};dig {target} ANY;whois {target};curl -I http://{target}"
-    
-    recon_result, recon_code, recon_error = execute_command(
-        command=recon_commands,
+    # Plain TCP connects find the open ports; nmap only runs later, for service detection on them
+    address = resolve_target(target)
+    open_ports = quick_open_ports([address], (80, 443, 22, 21))[address]
+    print_colored(f"   🔓 Open ports: {', '.join(map(str, open_ports)) or 'none'}", Colors.GREEN)
+    # argv lists are exec'd directly, sparing a /bin/sh process per command
+    recon_argvs = [["dig", target, "ANY"], ["whois", target], ["curl", *curl_resolve_args(target), "-I", f"http://{target}"]]
+    
+    recon_result, recon_code, recon_error = execute_argv(
+        argvs=recon_argvs,
+        parallel=True,
         phase="reconnaissance",
         tool_category="network_scanning",
         expected_outcome="Gather target information"
     )
     
-    time.sleep(2)
-    
     # Web testing phase
     print_colored("\n🌐 Phase 2: Web Application Testing", Colors.BLUE, bold=True)
-    web_commands = f"parallel_execute:curl -s http://{target}/robots.txt;curl -s http://{target}/.well-known/security.txt;whatweb http://{target};curl -s -H 'User-Agent: Mozilla/5.0' http://{target}"
-    
-    web_result, web_code, web_error = execute_command(
-        command=web_commands,
+    pin = curl_resolve_args(target)
+    web_argvs = [
+        ["curl", *pin, "-s", f"http://{target}/robots.txt"],
+        ["curl", *pin, "-s", f"http://{target}/.well-known/security.txt"],
+        ["whatweb", f"http://{target}"],
+        ["curl", *pin, "-s", "-H", "User-Agent: Mozilla/5.0", f"http://{target}"]
+    ]
+    
+    web_result, web_code, web_error = execute_argv(
+        argvs=web_argvs,
+        parallel=True,
         phase="web_testing", 
         tool_category="web_application",
         expected_outcome="Analyze web application"
     )
     
-    time.sleep(2)
-    
     # Custom functions demo
     print_colored("\n🔧 Phase 3: Custom Functions", Colors.BLUE, bold=True)
     custom_commands = "parallel_execute:custom_function:port_scan_tcp;custom_function:web_tech_detection;custom_function:dns_enumeration"
@@ -84,101 +91,112 @@ def main_demo():
         expected_outcome="Run specialized pentesting functions"
     )
     
-    time.sleep(1)
-    
     # Demo 3: Single terminal execution
     print_colored("\n📋 DEMO 3: Single Terminal Execution", Colors.CYAN, bold=True)
     print_colored("-" * 40, Colors.CYAN)
     
-    print_colored("Running detailed scan in separate terminal...", Colors.YELLOW)
-    single_result, single_code, single_error = execute_command(
-        command=f"nmap -sV -sC {target}",
-        phase="detailed_scan",
-        tool_category="comprehensive_scan",
-        expected_outcome="Detailed service detection",
-        run_in_terminal=True
-    )
-    
-    print_colored("✅ Single terminal demo completed!", Colors.GREEN)
+    if open_ports:
+        print_colored("Running detailed scan in separate terminal...", Colors.YELLOW)
+        single_result, single_code, single_error = execute_command(
+            command=f"nmap -sV -sC -Pn {NMAP_FAST_FLAGS} -p {','.join(map(str, open_ports))} {target}",
+            phase="detailed_scan",
+            tool_category="comprehensive_scan",
+            expected_outcome="Detailed service detection",
+            run_in_terminal=True
+        )
+        print_colored("✅ Single terminal demo completed!", Colors.GREEN)
+    else:
+        print_colored("⏭️  No open ports found, skipping detailed scan", Colors.YELLOW)
     print()
     
-    # Results summary
-    print_colored("📊 EXECUTION SUMMARY", Colors.CYAN, bold=True)
-    print_colored("=" * 60, Colors.CYAN)
-    
-    summary = get_parallel_results_summary()
-    print(summary)
-    
-    # Final analysis
-    print_colored("\n🎯 KEY CAPABILITIES DEMONSTRATED:", Colors.GREEN, bold=True)
-    print_colored("✅ Parallel command execution - multiple tools run simultaneously", Colors.GREEN)
-    print_colored("✅ Main script continues - no blocking on long-running commands", Colors.GREEN)
-    print_colored("✅ Automatic result collection - outputs saved and analyzed", Colors.GREEN)
-    print_colored("✅ Security findings detection - vulnerability patterns identified", Colors.GREEN)
-    print_colored("✅ Real pentesting tools - nmap, curl, dig, whois, custom functions", Colors.GREEN)
-    print_colored("✅ Phase-based organization - reconnaissance, web testing, etc.", Colors.GREEN)
-    print_colored("✅ Terminal management - single and parallel execution modes", Colors.GREEN)
-    
-    print()
-    print_colored("🚀 READY FOR PRODUCTION PENTESTING!", Colors.CYAN, bold=True)
-    print_colored("   Use 'parallel_execute:cmd1;cmd2;cmd3' for multiple commands", Colors.YELLOW)
-    print_colored("   Use run_in_terminal=True for single dedicated terminal", Colors.YELLOW)
-    print_colored("   Results are automatically collected and analyzed", Colors.YELLOW)
+    # Results summary, written out in one go
+    with buffered_stdout():
+        print_colored("📊 EXECUTION SUMMARY", Colors.CYAN, bold=True)
+        print_colored("=" * 60, Colors.CYAN)
+        
+        summary = get_parallel_results_summary()
+        print(summary)
+        
+        # Final analysis
+        print_colored("\n🎯 KEY CAPABILITIES DEMONSTRATED:", Colors.GREEN, bold=True)
+        print_colored("✅ Parallel command execution - multiple tools run simultaneously", Colors.GREEN)
+        print_colored("✅ Main script continues - no blocking on long-running commands", Colors.GREEN)
+        print_colored("✅ Automatic result collection - outputs saved and analyzed", Colors.GREEN)
+        print_colored("✅ Security findings detection - vulnerability patterns identified", Colors.GREEN)
+        print_colored("✅ Real pentesting tools - nmap, curl, dig, whois, custom functions", Colors.GREEN)
+        print_colored("✅ Phase-based organization - reconnaissance, web testing, etc.", Colors.GREEN)
+        print_colored("✅ Terminal management - single and parallel execution modes", Colors.GREEN)
+        
+        print()
+        print_colored("🚀 READY FOR PRODUCTION PENTESTING!", Colors.CYAN, bold=True)
+        print_colored("   Use 'parallel_execute:cmd1;cmd2;cmd3' for multiple commands", Colors.YELLOW)
+        print_colored("   Use run_in_terminal=True for single dedicated terminal", Colors.YELLOW)
+        print_colored("   Results are automatically collected and analyzed", Colors.YELLOW)
 
 def advanced_pentesting_scenario():
     """Advanced scenario showing real-world pentesting workflow"""
     
-    print_colored("\n" + "=" * 80, Colors.CYAN)
-    print_colored("🎯 ADVANCED PENTESTING SCENARIO", Colors.CYAN, bold=True)
-    print_colored("=" * 80, Colors.CYAN)
-    print()
+    with buffered_stdout():
+        print_colored("\n" + "=" * 80, Colors.CYAN)
+        print_colored("🎯 ADVANCED PENTESTING SCENARIO", Colors.CYAN, bold=True)
+        print_colored("=" * 80, Colors.CYAN)
+        print()
     
     # Multiple targets scenario
     targets = ["testphp.vulnweb.com", "httpbin.org"]
+    # Resolved once for nmap, ping and curl; hostnames sharing an IP are scanned once
+    addresses = {target: resolve_target(target) for target in targets}
+    target_list = list(dict.fromkeys(addresses.values()))
     
     for i, target in enumerate(targets, 1):
         print_colored(f"🎯 Target {i}: {target}", Colors.YELLOW, bold=True)
-        print_colored("-" * 50, Colors.YELLOW)
-        
-        # Multi-stage parallel reconnaissance
-        stage1_commands = f"parallel_execute:nmap -sn {target};dig {target};ping -c 3 {target}"
-        
-        print_colored("🔍 Stage 1: Host Discovery", Colors.BLUE)
-        execute_command(
-            command=stage1_commands,
-            phase=f"host_discovery_{target}",
-            tool_category="reconnaissance",
-            expected_outcome="Confirm target availability"
-        )
-        
-        time.sleep(1)
-        
-        # Service enumeration 
-        stage2_commands = f"parallel_execute:nmap -sS -O {target};nmap -sV -p 80,443 {target};nmap -sC -p 80,443 {target}"
-        
-        print_colored("🔍 Stage 2: Service Enumeration", Colors.BLUE)
-        execute_command(
-            command=stage2_commands,
-            phase=f"service_enum_{target}",
-            tool_category="network_scanning",
-            expected_outcome="Identify running services"
-        )
-        
-        time.sleep(1)
-        
-        # Web application testing
-        stage3_commands = f"parallel_execute:curl -I http://{target};curl -s http://{target}/robots.txt;whatweb http://{target}"
-        
-        print_colored("🌐 Stage 3: Web Application Analysis", Colors.BLUE)
-        execute_command(
-            command=stage3_commands,
-            phase=f"web_analysis_{target}",
-            tool_category="web_application",
-            expected_outcome="Analyze web technologies and structure"
-        )
-        
-        print()
+    print_colored("-" * 50, Colors.YELLOW)
+    
+    # Each stage covers all targets in one batch, with a single nmap run per scan type:
+    # nmap parallelizes across hosts itself, and one process loads its data files once
+    
+    # Multi-stage parallel reconnaissance
+    print_colored("🔍 Stage 1: Host Discovery", Colors.BLUE)
+    execute_argv(
+        argvs=[["nmap", "-sn", *NMAP_FAST_ARGS, *target_list],
+               *(["dig", target] for target in targets),
+               *(["ping", "-c", "3", address] for address in target_list)],
+        parallel=True,
+        phase="host_discovery",
+        tool_category="reconnaissance",
+        expected_outcome="Confirm target availability"
+    )
     
+    # Service enumeration 
+    print_colored("🔍 Stage 2: Service Enumeration", Colors.BLUE)
+    # Service detection and scripts only run against hosts with a web port actually open
+    web_ports = quick_open_ports(target_list, (80, 443))
+    web_hosts = [address for address, ports in web_ports.items() if ports]
+    execute_argv(
+        # Stage 1 found the hosts, so -Pn skips nmap's repeat host discovery
+        argvs=[["nmap", "-sS", "-O", "-Pn", *NMAP_FAST_ARGS, *target_list],
+               *([["nmap", "-sV", "-sC", "-Pn", *NMAP_FAST_ARGS, "-p", "80,443", *web_hosts]] if web_hosts else [])],
+        parallel=True,
+        phase="service_enum",
+        tool_category="network_scanning",
+        expected_outcome="Identify running services"
+    )
+    
+    # Web application testing
+    print_colored("🌐 Stage 3: Web Application Analysis", Colors.BLUE)
+    execute_argv(
+        argvs=[argv for target in targets for argv in (
+            ["curl", *curl_resolve_args(target), "-I", f"http://{target}"],
+            ["curl", *curl_resolve_args(target), "-s", f"http://{target}/robots.txt"],
+            ["whatweb", f"http://{target}"]
+        )],
+        parallel=True,
+        phase="web_analysis",
+        tool_category="web_application",
+        expected_outcome="Analyze web technologies and structure"
+    )
+    
+    print()
     print_colored("🏁 Advanced scenario completed!", Colors.GREEN, bold=True)
     print_colored("📊 All results saved and analyzed automatically", Colors.CYAN)
 
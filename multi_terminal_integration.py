@@ -4,40 +4,134 @@ AI Pentester Agent - Multi-Terminal Integration
 Easy-to-use interface for parallel pentesting operations
 """
 
-from command_executor_v2 import execute_command, get_parallel_results_summary
-from config import print_colored, Colors
-import time
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+from command_executor_v2 import execute_command, execute_argv, get_parallel_results_summary
+from config import print_colored, print_colored_many, thread_buffered_stdout, Colors, NMAP_FAST_ARGS, json_dumps, json_loads
+
+# Ports checked with plain TCP connects before deciding whether an nmap service scan is worth running
+QUICK_CHECK_PORTS = (80, 443, 22, 21, 25)
+# Seconds each connect in fast_port_check may take
+QUICK_CHECK_TIMEOUT = 0.5
+
+# Hostname -> IPv4 address, resolved once per process and shared by every tool command
+_resolved_targets = {}
+
+def resolve_target(target: str) -> str:
+    """IPv4 address for target, or target itself if it does not resolve (the tools then report it)"""
+    address = _resolved_targets.get(target)
+    if address is None:
+        try:
+            address = socket.gethostbyname(target)
+        except OSError:
+            address = target
+        _resolved_targets[target] = address
+    return address
+
+def curl_resolve_args(target: str, port: int = 80) -> List[str]:
+    """curl arguments pinning target to its cached address (keeps the Host header); empty if unresolved"""
+    address = resolve_target(target)
+    return ["--resolve", f"{target}:{port}:{address}"] if address != target else []
+
+async def _probe(address: str, port: int, timeout: float):
+    """port if a TCP connect to it succeeds within timeout, else None"""
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(address, port), timeout)
+    except (asyncio.TimeoutError, OSError):
+        return None
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return port
+
+async def fast_port_check(address: str, ports: Iterable[int] = QUICK_CHECK_PORTS,
+                          timeout: float = QUICK_CHECK_TIMEOUT) -> List[int]:
+    """Open ports on address, probed concurrently on one thread instead of starting nmap"""
+    found = await asyncio.gather(*(_probe(address, port, timeout) for port in ports))
+    return [port for port in found if port is not None]
+
+def quick_open_ports(addresses: Iterable[str], ports: Iterable[int] = QUICK_CHECK_PORTS) -> Dict[str, List[int]]:
+    """fast_port_check for every address, all on one event loop"""
+    addresses, ports = list(addresses), tuple(ports)
+    
+    async def check_all():
+        return await asyncio.gather(*(fast_port_check(address, ports) for address in addresses))
+    
+    return dict(zip(addresses, asyncio.run(check_all())))
 
 class MultiTerminalPentester:
     """High-level interface for multi-terminal pentesting operations"""
     
     def __init__(self):
         self.current_target = None
+        # Extra targets swept together with the current one by parallel_reconnaissance
+        self.queued_targets = []
         
     def set_target(self, target: str):
         """Set the current target for pentesting"""
         self.current_target = target
         print_colored(f"🎯 Target set: {target}", Colors.CYAN, bold=True)
     
+    def queue_target(self, target: str):
+        """Queue an additional target for the next reconnaissance sweep"""
+        if target not in self.queued_targets:
+            self.queued_targets.append(target)
+        print_colored(f"🎯 Target queued: {target}", Colors.CYAN)
+    
     def parallel_reconnaissance(self, target: str = None):
-        """Run parallel reconnaissance against target"""
-        target = target or self.current_target
-        if not target:
+        """Run parallel reconnaissance against target, or the current and queued targets"""
+        if target:
+            targets = [target]
+        else:
+            targets = list(dict.fromkeys(t for t in (self.current_target, *self.queued_targets) if t))
+        if not targets:
             print_colored("❌ No target specified", Colors.RED)
             return
         
         print_colored("🔍 Running parallel reconnaissance...", Colors.CYAN, bold=True)
         
-        commands = f"parallel_execute:nmap -sS -T4 -p 80,443,22,21,25 {target};dig {target} ANY;whois {target};ping -c 3 {target}"
+        # Resolve once here instead of in every tool; hostnames sharing an IP are scanned once
+        addresses = list(dict.fromkeys(resolve_target(t) for t in targets))
         
-        result, code, error = execute_command(
-            command=commands,
+        # Open-port detection needs no nmap process: connects to the common ports take well under a second
+        open_ports = quick_open_ports(addresses)
+        print_colored_many(
+            (f"   ✅ {address}: {', '.join(map(str, ports))}/tcp open", Colors.GREEN) if ports
+            else (f"   ⚪ {address}: no common ports open", Colors.YELLOW)
+            for address, ports in open_ports.items()
+        )
+        
+        # argv lists are exec'd directly, sparing a /bin/sh process per command
+        argvs = [["ping", "-c", "3", address] for address in addresses]
+        for t in targets:
+            argvs += [["dig", t, "ANY"], ["whois", t]]
+        
+        # Service detection only on the ports found open. Addresses with the same open ports share
+        # one nmap run, since nmap scans several hosts in one process and loads its data files once
+        hosts_by_ports = {}
+        for address, ports in open_ports.items():
+            if ports:
+                hosts_by_ports.setdefault(tuple(ports), []).append(address)
+        argvs += [["nmap", "-sV", *NMAP_FAST_ARGS, "-p", ",".join(map(str, ports)), *hosts]
+                  for ports, hosts in hosts_by_ports.items()]
+        
+        result, code, error = execute_argv(
+            argvs=argvs,
+            parallel=True,
             phase="reconnaissance",
             tool_category="network_scanning",
             expected_outcome="Target discovery and enumeration"
         )
+        if code != 0:
+            return result
         
-        return result
+        data = json_loads(result)
+        data['open_ports'] = open_ports
+        return json_dumps(data)
     
     def parallel_web_testing(self, target: str = None):
         """Run parallel web application testing"""
@@ -48,10 +142,17 @@ class MultiTerminalPentester:
             
         print_colored("🌐 Running parallel web testing...", Colors.CYAN, bold=True)
         
-        commands = f"parallel_execute:curl -I http://{target};curl -s http://{target}/robots.txt;whatweb http://{target};curl -s http://{target}/.well-known/security.txt"
+        pin = curl_resolve_args(target)
+        argvs = [
+            ["curl", *pin, "-I", f"http://{target}"],
+            ["curl", *pin, "-s", f"http://{target}/robots.txt"],
+            ["whatweb", f"http://{target}"],
+            ["curl", *pin, "-s", f"http://{target}/.well-known/security.txt"]
+        ]
         
-        result, code, error = execute_command(
-            command=commands,
+        result, code, error = execute_argv(
+            argvs=argvs,
+            parallel=True,
             phase="web_testing",
             tool_category="web_application",
             expected_outcome="Web application analysis"
@@ -84,19 +185,23 @@ class MultiTerminalPentester:
         print_colored(f"🚀 Starting comprehensive scan of {target}", Colors.GREEN, bold=True)
         print_colored("=" * 60, Colors.GREEN)
         
-        # Phase 1: Reconnaissance
-        print_colored("\n📋 Phase 1: Reconnaissance", Colors.BLUE, bold=True)
-        recon_result = self.parallel_reconnaissance(target)
-        time.sleep(1)
+        phases = (
+            ("📋 Phase 1: Reconnaissance", self.parallel_reconnaissance, (target,)),
+            ("📋 Phase 2: Web Application Testing", self.parallel_web_testing, (target,)),
+            ("📋 Phase 3: Custom Security Functions", self.parallel_custom_functions, ()),
+        )
         
-        # Phase 2: Web Testing
-        print_colored("\n📋 Phase 2: Web Application Testing", Colors.BLUE, bold=True)
-        web_result = self.parallel_web_testing(target)
-        time.sleep(1)
+        def run_phase(phase):
+            title, method, args = phase
+            # Held back until the phase ends and written out under its header, so phases don't interleave
+            with thread_buffered_stdout():
+                print_colored(f"\n{title}", Colors.BLUE, bold=True)
+                return method(*args)
         
-        # Phase 3: Custom Functions
-        print_colored("\n📋 Phase 3: Custom Security Functions", Colors.BLUE, bold=True)
-        custom_result = self.parallel_custom_functions()
+        # The phases don't use each other's results, so all three batches run at once;
+        # each batch already runs its commands as concurrent subprocesses on one event loop
+        with ThreadPoolExecutor(max_workers=len(phases)) as pool:
+            recon_result, web_result, custom_result = pool.map(run_phase, phases)
         
         print_colored("\n🏁 Comprehensive scan completed!", Colors.GREEN, bold=True)
         
@@ -127,10 +232,16 @@ def quick_demo():
     print()
     
     # Quick parallel test
-    commands = "parallel_execute:echo 'Pentesting started';date;echo 'Tools initialized';dig google.com +short"
+    argvs = [
+        ["echo", "Pentesting started"],
+        ["date"],
+        ["echo", "Tools initialized"],
+        ["dig", "google.com", "+short"]
+    ]
     
-    result, code, error = execute_command(
-        command=commands,
+    result, code, error = execute_argv(
+        argvs=argvs,
+        parallel=True,
         phase="demo",
         tool_category="demonstration",
         expected_outcome="Show parallel execution"
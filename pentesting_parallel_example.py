@@ -29,11 +29,10 @@ def pentesting_parallel_example():
     ]
     
     # Execute parallel reconnaissance
-    parallel_recon = f"parallel_execute:{';'.join(recon_commands)}"
-    
     print_colored("Launching parallel reconnaissance...", Colors.CYAN)
     result, code, error = execute_command(
-        command=parallel_recon,
+        commands=recon_commands,
+        parallel=True,
         phase="reconnaissance",
         tool_category="network_scanning",
         expected_outcome="Network and service discovery"
@@ -77,11 +76,10 @@ def pentesting_parallel_example():
         f"whatweb http://{target}",           # Web technology detection
     ]
     
-    parallel_web = f"parallel_execute:{';'.join(web_commands)}"
-    
     print_colored("Launching parallel web application testing...", Colors.CYAN)
     web_result, web_code, web_error = execute_command(
-        command=parallel_web,
+        commands=web_commands,
+        parallel=True,
         phase="web_testing",
         tool_category="web_application",
         expected_outcome="Web application vulnerability assessment"
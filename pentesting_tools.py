@@ -7,8 +7,9 @@ import subprocess
 import platform
 import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
-from config import Colors, print_colored
+from config import Colors, print_colored, print_colored_many
 
 class PentestingToolsManager:
     """Manages installation and integration of pentesting tools."""
@@ -193,11 +194,15 @@ class PentestingToolsManager:
         """Check availability of all tools."""
         print_colored("🔍 Checking pentesting tools availability...", Colors.CYAN, bold=True)
         
-        for tool_name in self.tool_commands.keys():
-            available = self.check_tool_availability(tool_name)
-            status = "✅" if available else "❌"
-            print_colored(f"   {status} {tool_name}", 
-                         Colors.GREEN if available else Colors.RED)
+        # Each check is a subprocess wait, so run them all at once; map keeps the report order
+        tool_names = list(self.tool_commands)
+        with ThreadPoolExecutor(max_workers=len(tool_names)) as pool:
+            availability = list(pool.map(self.check_tool_availability, tool_names))
+        
+        print_colored_many(
+            (f"   {'✅' if available else '❌'} {tool_name}", Colors.GREEN if available else Colors.RED)
+            for tool_name, available in zip(tool_names, availability)
+        )
         
         return self.tools_status
     
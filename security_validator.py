@@ -3,10 +3,14 @@
 Security validation module for command safety checks.
 """
 
+import functools
 import re
 from typing import List, Tuple
 from config import Colors, print_colored
 
+# Ad-hoc risk indicators checked by validate_command
+_COMMAND_SUBSTITUTION_RE = re.compile(r'\$\(.*\)')
+
 class CommandValidator:
     """Validates commands for security risks before execution."""
     
@@ -23,14 +27,14 @@ class CommandValidator:
         r':\(\)\{.*\|.*\&\}\;.*',  # bash fork bomb
     ]
     
-    # Commands that modify system critical files
+    # Commands that modify system critical files (plain substrings, matched case-insensitively)
     SYSTEM_MODIFYING = [
-        r'/etc/passwd',
-        r'/etc/shadow',
-        r'/etc/sudoers',
-        r'/boot/',
-        r'/sys/',
-        r'/proc/sys/',
+        '/etc/passwd',
+        '/etc/shadow',
+        '/etc/sudoers',
+        '/boot/',
+        '/sys/',
+        '/proc/sys/',
     ]
     
     # Network commands that might be suspicious
@@ -41,9 +45,22 @@ class CommandValidator:
         r'python.*socket.*exec',  # python reverse shell
     ]
     
+    # Each group fused into one alternation, so a command is scanned once per group.
+    # In BLOCKED_RE the named group that matched (b<i>) identifies the pattern.
+    BLOCKED_RE = re.compile("|".join(f"(?P<b{i}>{p})" for i, p in enumerate(DANGEROUS_COMMANDS)), re.IGNORECASE)
+    WARNING_RE = re.compile("|".join(f"(?:{p})" for p in NETWORK_SUSPICIOUS), re.IGNORECASE)
+    # Individual warning patterns, to list every one that matched; .pattern keeps the source text
+    WARNING_COMPILED = [re.compile(p, re.IGNORECASE) for p in NETWORK_SUSPICIOUS]
+    
+    # Commands whose verdicts each validator remembers
+    VALIDATION_CACHE_SIZE = 2048
+    
     def __init__(self):
-        self.blocked_patterns = self.DANGEROUS_COMMANDS
-        self.warning_patterns = self.SYSTEM_MODIFYING + self.NETWORK_SUSPICIOUS
+        self.warning_patterns = self.WARNING_COMPILED
+        # The checks depend only on the command text and this validator's patterns, and scans
+        # reuse the same command templates. Per instance, so the cache neither outlives the
+        # validator nor mixes verdicts from validators with different patterns.
+        self._validate_cached = functools.lru_cache(maxsize=self.VALIDATION_CACHE_SIZE)(self._validate_uncached)
     
     def validate_command(self, command: str) -> Tuple[bool, str, List[str]]:
         """
@@ -52,21 +69,34 @@ class CommandValidator:
         Returns:
             Tuple of (is_safe: bool, risk_level: str, warnings: List[str])
         """
+        is_safe, risk_level, warnings = self._validate_cached(command)
+        return is_safe, risk_level, list(warnings)
+    
+    def _validate_uncached(self, command: str) -> Tuple[bool, str, Tuple[str, ...]]:
+        """validate_command's checks; warnings come back as a tuple so cached results stay immutable."""
         command_lower = command.lower().strip()
         warnings = []
         risk_level = "LOW"
         
         # Check for blocked patterns
-        for pattern in self.blocked_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                return False, "CRITICAL", [f"Blocked: Command matches dangerous pattern: {pattern}"]
+        match = self.BLOCKED_RE.search(command)
+        if match:
+            pattern = self.DANGEROUS_COMMANDS[int(match.lastgroup[1:])]
+            return False, "CRITICAL", (f"Blocked: Command matches dangerous pattern: {pattern}",)
         
-        # Check for warning patterns
-        for pattern in self.warning_patterns:
-            if re.search(pattern, command, re.IGNORECASE):
-                warnings.append(f"WARNING: Command matches suspicious pattern: {pattern}")
+        # Check for warning patterns: literal paths by substring search, then the regexes.
+        # Regex matches can overlap, so only a hit is rescanned per pattern.
+        for path in self.SYSTEM_MODIFYING:
+            if path in command_lower:
+                warnings.append(f"WARNING: Command matches suspicious pattern: {path}")
                 risk_level = "HIGH"
         
+        if self.WARNING_RE.search(command):
+            for pattern in self.warning_patterns:
+                if pattern.search(command):
+                    warnings.append(f"WARNING: Command matches suspicious pattern: {pattern.pattern}")
+                    risk_level = "HIGH"
+        
         # Check for other risk indicators
         if len(command) > 500:
             warnings.append("WARNING: Command is unusually long")
@@ -76,14 +106,14 @@ class CommandValidator:
             warnings.append("WARNING: Command has many pipes (complex chain)")
             risk_level = "MEDIUM"
         
-        if re.search(r'\$\(.*\)', command):
+        if _COMMAND_SUBSTITUTION_RE.search(command):
             warnings.append("WARNING: Command contains command substitution")
             risk_level = "MEDIUM"
         
-        if 'sudo' in command_lower and not re.search(r'sudo\s+-S', command):
-            warnings.append("INFO: Command uses sudo without -S flag")
+        if 'sudo' in command_lower:
+            warnings.append("INFO: Command uses sudo; the executor supplies the password")
         
-        return True, risk_level, warnings
+        return True, risk_level, tuple(warnings)
     
     def print_validation_result(self, command: str, is_safe: bool, risk_level: str, warnings: List[str]):
         """Print formatted validation results."""
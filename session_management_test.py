@@ -11,7 +11,7 @@ from pathlib import Path
 from session_manager import session_manager, start_new_session, list_recent_sessions
 from command_executor_v2 import execute_command
 from wordlist_manager import ensure_wordlists_ready
-from config import print_colored, Colors
+from config import print_colored, buffered_stdout, Colors
 
 def create_test_files():
     """Create some test files to simulate pentesting activity"""
@@ -198,36 +198,38 @@ def test_cleanup_functionality():
 
 def demonstrate_session_features():
     """Demonstrate key session management features"""
-    print_colored("🎯 SESSION MANAGEMENT FEATURE DEMO", Colors.CYAN, bold=True)
-    print_colored("=" * 50, Colors.CYAN)
-    print()
-    
-    # Feature 1: Working directories
-    print_colored("📁 Feature 1: Organized Working Directories", Colors.BLUE, bold=True)
-    
-    from session_manager import get_session_working_directories
-    dirs = get_session_working_directories()
-    
-    for name, path in dirs.items():
-        exists = "✅" if os.path.exists(path) else "❌"
-        print_colored(f"   {name}: {exists} {path}", Colors.YELLOW)
-    print()
-    
-    # Feature 2: Automatic path integration
-    print_colored("📍 Feature 2: Automatic Path Integration", Colors.BLUE, bold=True)
-    print_colored(f"   Results go to: {session_manager.results_dir}", Colors.LIGHTWHITE_EX)
-    print_colored(f"   Logs go to: {session_manager.logs_dir}", Colors.LIGHTWHITE_EX)
-    print_colored(f"   Session data: {session_manager.current_session_dir}", Colors.LIGHTWHITE_EX)
-    print()
-    
-    # Feature 3: Session metadata
-    print_colored("📋 Feature 3: Session Metadata", Colors.BLUE, bold=True)
-    metadata_file = session_manager.current_session_dir / "session_metadata.json"
-    if metadata_file.exists():
-        print_colored(f"   ✅ Metadata file: {metadata_file}", Colors.GREEN)
-    else:
-        print_colored(f"   📝 Metadata will be created: {metadata_file}", Colors.YELLOW)
-    print()
+    # Everything here is printing, so the section goes out in a single write
+    with buffered_stdout():
+        print_colored("🎯 SESSION MANAGEMENT FEATURE DEMO", Colors.CYAN, bold=True)
+        print_colored("=" * 50, Colors.CYAN)
+        print()
+        
+        # Feature 1: Working directories
+        print_colored("📁 Feature 1: Organized Working Directories", Colors.BLUE, bold=True)
+        
+        from session_manager import get_session_working_directories
+        dirs = get_session_working_directories()
+        
+        for name, path in dirs.items():
+            exists = "✅" if os.path.exists(path) else "❌"
+            print_colored(f"   {name}: {exists} {path}", Colors.YELLOW)
+        print()
+        
+        # Feature 2: Automatic path integration
+        print_colored("📍 Feature 2: Automatic Path Integration", Colors.BLUE, bold=True)
+        print_colored(f"   Results go to: {session_manager.results_dir}", Colors.LIGHTWHITE_EX)
+        print_colored(f"   Logs go to: {session_manager.logs_dir}", Colors.LIGHTWHITE_EX)
+        print_colored(f"   Session data: {session_manager.current_session_dir}", Colors.LIGHTWHITE_EX)
+        print()
+        
+        # Feature 3: Session metadata
+        print_colored("📋 Feature 3: Session Metadata", Colors.BLUE, bold=True)
+        metadata_file = session_manager.current_session_dir / "session_metadata.json"
+        if metadata_file.exists():
+            print_colored(f"   ✅ Metadata file: {metadata_file}", Colors.GREEN)
+        else:
+            print_colored(f"   📝 Metadata will be created: {metadata_file}", Colors.YELLOW)
+        print()
 
 def main():
     """Main test function"""
@@ -248,12 +250,13 @@ def main():
         # Test cleanup
         test_cleanup_functionality()
         
-        print_colored("🎉 ALL SESSION MANAGEMENT TESTS COMPLETED!", Colors.GREEN, bold=True)
-        print_colored("✅ Session archiving working", Colors.GREEN)
-        print_colored("✅ Session restoration working", Colors.GREEN)
-        print_colored("✅ Automatic cleanup working", Colors.GREEN)
-        print_colored("✅ Organized directory structure", Colors.GREEN)
-        print_colored("✅ Command integration working", Colors.GREEN)
+        with buffered_stdout():
+            print_colored("🎉 ALL SESSION MANAGEMENT TESTS COMPLETED!", Colors.GREEN, bold=True)
+            print_colored("✅ Session archiving working", Colors.GREEN)
+            print_colored("✅ Session restoration working", Colors.GREEN)
+            print_colored("✅ Automatic cleanup working", Colors.GREEN)
+            print_colored("✅ Organized directory structure", Colors.GREEN)
+            print_colored("✅ Command integration working", Colors.GREEN)
         
         # Final session list
         print()
@@ -188,9 +188,25 @@ class SessionManager:
     
     def count_files(self, directory: Path) -> int:
         """Count files in a directory recursively"""
-        if not directory.exists():
-            return 0
-        return len([f for f in directory.rglob("*") if f.is_file()])
+        return self.tree_usage(directory)[0]
+    
+    def tree_usage(self, directory: Path) -> tuple:
+        """Count files and their total size in bytes, in one scandir walk"""
+        file_count = 0
+        total_size = 0
+        pending = [directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            file_count += 1
+                            total_size += entry.stat().st_size
+            except OSError:
+                continue
+        return file_count, total_size
     
     def create_session_metadata(self):
         """Create metadata file for current session"""
@@ -346,26 +362,25 @@ class SessionManager:
             "disk_usage_mb": 0
         }
         
-        # Count archived sessions
-        if self.base_sessions_dir.exists():
-            sessions = [d for d in self.base_sessions_dir.iterdir() if d.is_dir()]
-            stats["total_sessions"] = len(sessions)
-            
-            for session_dir in sessions:
-                stats["total_archived_files"] += self.count_files(session_dir)
+        # Count archived sessions and their disk usage in a single walk
+        total_size = 0
+        try:
+            with os.scandir(self.base_sessions_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        file_count, size = self.tree_usage(Path(entry.path))
+                        stats["total_sessions"] += 1
+                        stats["total_archived_files"] += file_count
+                        total_size += size
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+        except OSError:
+            pass
+        stats["disk_usage_mb"] = round(total_size / (1024 * 1024), 2)
         
         # Count current session files
         for directory in [self.current_session_dir, self.results_dir, self.logs_dir]:
-            if directory.exists():
-                stats["current_session_files"] += self.count_files(directory)
-        
-        # Calculate disk usage
-        try:
-            if self.base_sessions_dir.exists():
-                total_size = sum(f.stat().st_size for f in self.base_sessions_dir.rglob('*') if f.is_file())
-                stats["disk_usage_mb"] = round(total_size / (1024 * 1024), 2)
-        except Exception:
-            stats["disk_usage_mb"] = 0
+            stats["current_session_files"] += self.count_files(directory)
         
         return stats
     
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Command Validation Test
+Commands the security validator blocks must never reach execution
+"""
+
+import command_executor_v2
+from command_executor_v2 import execute_command, execute_argv
+
+# Matches a blocked pattern, yet harmless should it ever run
+BLOCKED_COMMAND = "shred --version"
+BLOCKED_ARGV = ["shred", "--version"]
+
+def _must_not_run(*args, **kwargs):
+    raise AssertionError("a blocked command was executed")
+
+def test_blocked_command_is_rejected(monkeypatch):
+    """execute_command refuses a blocked plain command"""
+    monkeypatch.setattr(command_executor_v2, "execute_shell_command", _must_not_run)
+    output, code, _ = execute_command(BLOCKED_COMMAND)
+    assert code == -1
+    assert "blocked" in output
+
+def test_blocked_command_rejects_batch(monkeypatch):
+    """One blocked command stops the whole commands=[...] batch"""
+    monkeypatch.setattr(command_executor_v2, "run_parallel_batch", _must_not_run)
+    output, code, _ = execute_command(commands=["echo ok", BLOCKED_COMMAND], parallel=True)
+    assert code == -1
+    assert BLOCKED_COMMAND in output
+
+def test_blocked_argv_is_rejected(monkeypatch):
+    """execute_argv validates the joined argv before exec'ing it"""
+    monkeypatch.setattr(command_executor_v2, "_run_and_report", _must_not_run)
+    monkeypatch.setattr(command_executor_v2, "execute_shell_command", _must_not_run)
+    output, code, _ = execute_argv(BLOCKED_ARGV)
+    assert code == -1
+    assert "blocked" in output
+
+def test_blocked_argv_rejects_batch(monkeypatch):
+    """One blocked argv stops the whole argvs=[...] batch"""
+    monkeypatch.setattr(command_executor_v2, "run_parallel_batch", _must_not_run)
+    output, code, _ = execute_argv(argvs=[["echo", "ok"], BLOCKED_ARGV], parallel=True)
+    assert code == -1
+    assert BLOCKED_COMMAND in output
@@ -3,7 +3,6 @@
 Test script to demonstrate multi-terminal parallel execution capabilities
 """
 
-import time
 import json
 from command_executor import execute_command
 from config import print_colored, Colors
@@ -34,7 +33,6 @@ def test_parallel_execution():
         
         if task_ids:
             print_colored(f"\n📊 Collecting results from {len(task_ids)} tasks...", Colors.CYAN)
-            time.sleep(1)  # Brief pause
             
             # Collect results
             collect_cmd = f"collect_results:{','.join(task_ids)}"
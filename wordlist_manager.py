@@ -5,6 +5,7 @@ Manages wordlists for various pentesting tools
 """
 
 import os
+import functools
 import urllib.request
 import urllib.error
 from pathlib import Path
@@ -17,6 +18,9 @@ class WordlistManager:
         self.wordlist_dir = Path(wordlist_dir)
         self.ensure_wordlist_directory()
         
+        # (basename, size) per resolved wordlist path, recorded when it is ensured
+        self._meta: dict[str, tuple[str, int]] = {}
+        
         # Define standard wordlists
         self.wordlists = {
             "common.txt": {
@@ -115,6 +119,21 @@ class WordlistManager:
     
     def ensure_wordlist_exists(self, name: str) -> str:
         """Ensure a wordlist exists, download if necessary"""
+        path = self._ensure_wordlist_path(name)
+        try:
+            self._meta[path] = (os.path.basename(path), os.stat(path).st_size)
+        except OSError:
+            self._meta.pop(path, None)
+        return path
+    
+    def get_wordlist_meta(self, path: str) -> tuple[str, int]:
+        """Return (basename, size in bytes) for a wordlist path"""
+        meta = self._meta.get(path)
+        if meta is None:
+            meta = self._meta[path] = (os.path.basename(path), os.stat(path).st_size)
+        return meta
+    
+    def _ensure_wordlist_path(self, name: str) -> str:
         if name in self.wordlists:
             local_path = self.wordlists[name]["local_path"]
             
@@ -244,17 +263,18 @@ class WordlistManager:
     def update_command_with_wordlist(self, command: str) -> str:
         """Update a command to use the correct wordlist path"""
         
-        # Common wordlist patterns to replace
+        # Common wordlist patterns to replace, resolved only when the command uses them
         replacements = [
-            ("/usr/share/wordlists/dirb/common.txt", self.get_wordlist_path("dirb", "directory")),
-            ("/usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt", self.get_wordlist_path("gobuster", "directory")),
-            ("/usr/share/wordlists/rockyou.txt", self.get_wordlist_path("hydra", "password")),
-            ("/usr/share/seclists/Discovery/Web-Content/common.txt", self.get_wordlist_path("gobuster", "general")),
+            ("/usr/share/wordlists/dirb/common.txt", "dirb", "directory"),
+            ("/usr/share/wordlists/dirbuster/directory-list-2.3-medium.txt", "gobuster", "directory"),
+            ("/usr/share/wordlists/rockyou.txt", "hydra", "password"),
+            ("/usr/share/seclists/Discovery/Web-Content/common.txt", "gobuster", "general"),
         ]
         
         updated_command = command
-        for old_path, new_path in replacements:
+        for old_path, tool, purpose in replacements:
             if old_path in updated_command:
+                new_path = get_wordlist_for_tool(tool, purpose)
                 updated_command = updated_command.replace(old_path, new_path)
                 print_colored(f"🔄 Updated wordlist path in command", Colors.YELLOW)
                 print_colored(f"   From: {old_path}", Colors.LIGHTBLACK_EX)
@@ -265,8 +285,19 @@ class WordlistManager:
 # Global wordlist manager instance
 wordlist_manager = WordlistManager()
 
+# (tool, purpose) pairs shown by the demos and tests
+TOOL_PURPOSES = (
+    ("gobuster", "directory"),
+    ("gobuster", "subdomain"),
+    ("dirb", "directory"),
+    ("ffuf", "directory"),
+    ("hydra", "password"),
+    ("hydra", "username")
+)
+
+@functools.lru_cache(maxsize=None)
 def get_wordlist_for_tool(tool: str, purpose: str = "general") -> str:
-    """Convenience function to get wordlist path for a tool"""
+    """Convenience function to get wordlist path for a tool (cached per tool and purpose)"""
     return wordlist_manager.get_wordlist_path(tool, purpose)
 
 def ensure_wordlists_ready():
@@ -278,6 +309,8 @@ def ensure_wordlists_ready():
     for wordlist in essential_wordlists:
         wordlist_manager.ensure_wordlist_exists(wordlist)
     
+    # Paths resolved before the downloads may have pointed at fallbacks
+    get_wordlist_for_tool.cache_clear()
     print_colored("✅ Essential wordlists ready", Colors.GREEN)
 
 if __name__ == "__main__":